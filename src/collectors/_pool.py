@@ -0,0 +1,125 @@
+"""
+Shared IMAP connection pool for EmailReader instances.
+
+Readers for the same account hand their authenticated connection back
+here on exit instead of logging out, so the next reader skips the TLS
+handshake and LOGIN round trips. Idle connections are logged out when the
+interpreter exits.
+"""
+
+import atexit
+import hashlib
+import imaplib
+import logging
+import secrets
+import threading
+
+logger = logging.getLogger(__name__)
+
+# Idle connections kept per account; extras are logged out on release
+MAX_CONNECTIONS = 4
+
+PoolKey = tuple[str, int, str, bytes]
+
+# Per-process salt, so pool keys never hold a reusable password digest
+_KEY_SALT = secrets.token_bytes(16)
+
+_lock = threading.Lock()
+_idle: dict[PoolKey, list[imaplib.IMAP4_SSL]] = {}
+
+
+def make_key(host: str, port: int, account: str, password: str) -> PoolKey:
+    """
+    Build the pool key for an account without keeping its password.
+
+    The password is reduced to a salted digest, so a reader with different
+    credentials never borrows another reader's authenticated session.
+
+    Args:
+        host: IMAP server host
+        port: IMAP server port
+        account: Login name
+        password: Login password
+
+    Returns:
+        (host, port, account, password digest) identifying the account
+    """
+    digest = hashlib.blake2b(password.encode(), key=_KEY_SALT, digest_size=16)
+    return (host, port, account, digest.digest())
+
+
+def acquire(key: PoolKey) -> imaplib.IMAP4_SSL | None:
+    """
+    Take a live idle connection for an account out of the pool.
+
+    Each candidate is pinged with NOOP first; connections the server has
+    dropped are logged out and discarded.
+
+    Args:
+        key: Account key from make_key()
+
+    Returns:
+        Authenticated connection, or None if no live one is pooled
+    """
+    while True:
+        with _lock:
+            idle = _idle.get(key)
+            if not idle:
+                return None
+            connection = idle.pop()
+
+        try:
+            result, _ = connection.noop()
+            if result == "OK":
+                return connection
+            logger.debug(f"Discarding pooled IMAP connection: NOOP {result}")
+        except (imaplib.IMAP4.abort, imaplib.IMAP4.error, OSError) as e:
+            logger.debug(f"Discarding dead pooled IMAP connection: {e}")
+        _logout(connection)
+
+
+def release(key: PoolKey, connection: imaplib.IMAP4_SSL) -> None:
+    """
+    Return a connection to the pool, logging it out if the pool is full.
+
+    Args:
+        key: Account key from make_key()
+        connection: Authenticated connection to return
+    """
+    with _lock:
+        idle = _idle.setdefault(key, [])
+        if len(idle) < MAX_CONNECTIONS:
+            idle.append(connection)
+            return
+
+    _logout(connection)
+
+
+def drain() -> None:
+    """Log out and forget every pooled connection."""
+    with _lock:
+        connections = [conn for idle in _idle.values() for conn in idle]
+        _idle.clear()
+
+    for connection in connections:
+        _logout(connection)
+
+
+def _logout(connection: imaplib.IMAP4_SSL) -> None:
+    """
+    Log out a connection, closing the socket if LOGOUT fails.
+
+    Args:
+        connection: Connection to close
+    """
+    try:
+        connection.logout()
+    except Exception as e:
+        logger.warning(f"Error during pooled IMAP logout: {e}")
+        try:
+            connection.shutdown()
+        except OSError:
+            pass
+
+
+atexit.register(drain)
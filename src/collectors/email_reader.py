@@ -8,22 +8,107 @@ This module handles:
 - Content extraction and preprocessing
 """
 
-import email
+import functools
 import imaplib
 import logging
 import re
 import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
+from email import policy
 from email.header import decode_header
 from email.message import EmailMessage, Message
+from email.parser import BytesParser
+from types import MappingProxyType
 from typing import Any
 
 from bs4 import BeautifulSoup
 
+from src.collectors import _pool
 from src.processors.models import NewsletterContent
 
 logger = logging.getLogger(__name__)
 
+# Header fields needed to identify, classify and rank a newsletter
+_HEADER_FIELDS = "FROM SUBJECT DATE MESSAGE-ID"
+
+# Newsletter identification defaults, copied into each reader's patterns
+NEWSLETTER_SENDER_DOMAINS = (
+    "substack.com",
+    "newsletter.com",
+    "mailchimp.com",
+    "constantcontact.com",
+    "tldrnewsletter.com",
+)
+NEWSLETTER_SUBJECT_PATTERNS = (
+    r"newsletter",
+    r"weekly",
+    r"daily",
+    r"digest",
+    r"roundup",
+    r"update",
+)
+
+# Newsletter type keywords, in classification priority order
+NEWSLETTER_TYPE_KEYWORDS = {
+    "technology": (
+        "ai",
+        "tech",
+        "engineering",
+        "software",
+        "coding",
+        "developer",
+        "startup",
+    ),
+    "business": ("business", "finance", "market", "economy", "investment"),
+    "news": ("news", "daily", "breaking", "update", "headlines"),
+}
+
+# One optional lookahead per type, so a single match() reports every type
+# whose keywords occur anywhere in the text
+_NEWSLETTER_TYPE_RE = re.compile(
+    "".join(
+        f"(?:(?=.*?(?P<{newsletter_type}>{'|'.join(map(re.escape, keywords))})))?"
+        for newsletter_type, keywords in NEWSLETTER_TYPE_KEYWORDS.items()
+    ),
+    re.DOTALL,
+)
+
+# clean_content() patterns, compiled once at import
+_ZERO_WIDTH_RE = re.compile(r"[\u00AD\u200B\u200C\u200D\uFEFF]")
+_UNICODE_SPACE_RE = re.compile(r"[\u180E\u2000-\u200F\u2028-\u202F\u205F-\u206F]")
+_INVISIBLE_SPACE_RE = re.compile(r"[\u00A0\u202F\u2060\u034F]")
+_DIRECTION_MARK_RE = re.compile(r"[\u200E\u200F\u202A-\u202E]")
+_DEPRECATED_FORMAT_RE = re.compile(r"[\u206A-\u206F]")
+_WHITESPACE_RE = re.compile(r"\s+")
+_SOFT_HYPHEN_CGJ_RE = re.compile(r"­͏+")
+_LEADING_BRACKETS_RE = re.compile(r"^\s*[|\[\]\(\)]+\s*")
+
+_ANGLE_ADDRESS_RE = re.compile(r"<([^>]+)>")
+
+# Parses FETCH literals straight from bytes into EmailMessage objects
+_parse_bytes = BytesParser(policy=policy.default).parsebytes
+
+
+@functools.lru_cache(maxsize=32)
+def _compile_alternation(patterns: tuple[str, ...]) -> re.Pattern[str]:
+    """
+    Fuse patterns into a single case-insensitive alternation.
+
+    Args:
+        patterns: Regular expressions to combine
+
+    Returns:
+        Compiled pattern matching any of the inputs
+    """
+    return re.compile("|".join(f"(?:{p})" for p in patterns), re.IGNORECASE)
+
+
+def _clear_pattern_cache() -> None:
+    """Drop fused patterns compiled by _compile_alternation (for tests)."""
+    _compile_alternation.cache_clear()
+
 
 def decode_mime_header(header_value: str) -> str:
     """
@@ -73,31 +158,23 @@ def clean_content(content: str) -> str:
     # Remove invisible characters and control characters
 
     # Remove various invisible and control characters
-    content = re.sub(
-        r"[\u00AD\u200B\u200C\u200D\uFEFF]", "", content
-    )  # Soft hyphen, zero-width chars
-    content = re.sub(
-        r"[\u180E\u2000-\u200F\u2028-\u202F\u205F-\u206F]", " ", content
-    )  # Various spaces
+    content = _ZERO_WIDTH_RE.sub("", content)  # Soft hyphen, zero-width chars
+    content = _UNICODE_SPACE_RE.sub(" ", content)  # Various spaces
 
     # Remove specific problematic characters found in emails
-    content = re.sub(
-        r"[\u00A0\u202F\u2060\u034F]", " ", content
+    content = _INVISIBLE_SPACE_RE.sub(
+        " ", content
     )  # Non-breaking spaces and invisible chars
-    content = re.sub(
-        r"[\u200E\u200F\u202A-\u202E]", "", content
-    )  # Text direction marks
-    content = re.sub(r"[\u206A-\u206F]", "", content)  # Deprecated format characters
+    content = _DIRECTION_MARK_RE.sub("", content)  # Text direction marks
+    content = _DEPRECATED_FORMAT_RE.sub("", content)  # Deprecated format characters
 
     # Remove multiple consecutive spaces and clean whitespace
-    content = re.sub(r"\s+", " ", content)
+    content = _WHITESPACE_RE.sub(" ", content)
     content = content.strip()
 
     # Remove specific email artifacts
-    content = re.sub(r"­͏+", "", content)  # Remove specific problematic sequence
-    content = re.sub(
-        r"^\s*[|\[\]\(\)]+\s*", "", content
-    )  # Remove leading brackets/pipes
+    content = _SOFT_HYPHEN_CGJ_RE.sub("", content)  # Remove problematic sequence
+    content = _LEADING_BRACKETS_RE.sub("", content)  # Remove leading brackets/pipes
 
     return content
 
@@ -134,6 +211,8 @@ class EmailReader:
         password: str,
         max_retries: int = 3,
         retry_delay: float = 1.0,
+        fetch_batch_size: int = 100,
+        search_cache_ttl: float = 0.0,
     ):
         """
         Initialize EmailReader with connection parameters.
@@ -145,6 +224,9 @@ class EmailReader:
             password: App password for authentication
             max_retries: Maximum connection retry attempts
             retry_delay: Delay between retry attempts (seconds)
+            fetch_batch_size: Maximum number of messages per FETCH command
+            search_cache_ttl: Seconds to reuse SEARCH results (0, the default,
+                disables caching)
         """
         self.imap_server = imap_server
         self.imap_port = imap_port
@@ -152,35 +234,50 @@ class EmailReader:
         self.password = password
         self.max_retries = max_retries
         self.retry_delay = retry_delay
+        self.fetch_batch_size = fetch_batch_size
+        self.search_cache_ttl = search_cache_ttl
         self.connection: imaplib.IMAP4_SSL | None = None
+        self.mailbox = "INBOX"
+        self.message_count = 0
+
+        # (mailbox, message count, criteria) -> (uids, monotonic timestamp)
+        self._search_cache: dict[tuple[str, int, str], tuple[list[str], float]] = {}
 
         # Newsletter identification patterns
         self.newsletter_patterns = {
-            "sender_domains": [
-                "substack.com",
-                "newsletter.com",
-                "mailchimp.com",
-                "constantcontact.com",
-                "tldrnewsletter.com",
-            ],
-            "subject_patterns": [
-                r"newsletter",
-                r"weekly",
-                r"daily",
-                r"digest",
-                r"roundup",
-                r"update",
-            ],
+            "sender_domains": list(NEWSLETTER_SENDER_DOMAINS),
+            "subject_patterns": list(NEWSLETTER_SUBJECT_PATTERNS),
         }
 
     def __enter__(self) -> "EmailReader":
-        """Context manager entry."""
-        self.connect()
+        """Context manager entry, reusing a pooled connection when possible."""
+        self.connection = _pool.acquire(self._pool_key)
+        if self.connection is None:
+            self.connect()
+        else:
+            # A pooled connection may still have another reader's mailbox
+            # selected, so select ours to bring mailbox state back in line
+            self._search_cache.clear()
+            self.select_mailbox(self.mailbox)
         return self
 
     def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
-        """Context manager exit with cleanup."""
-        self.disconnect()
+        """Context manager exit, handing the connection back to the pool."""
+        if self.connection is None:
+            return
+
+        if exc_type is None:
+            _pool.release(self._pool_key, self.connection)
+            self.connection = None
+        else:
+            self.disconnect()
+
+    @property
+    def _pool_key(self) -> _pool.PoolKey:
+        """Account identity used to share pooled connections."""
+        return _pool.make_key(
+            self.imap_server, self.imap_port, self.email_address, self.password
+        )
 
     def connect(self) -> None:
         """
@@ -195,6 +292,7 @@ class EmailReader:
                     f"Connecting to IMAP server {self.imap_server}:{self.imap_port}"
                 )
                 self.connection = imaplib.IMAP4_SSL(self.imap_server, self.imap_port)
+                self._search_cache.clear()
 
                 # Authenticate
                 result, data = self.connection.login(self.email_address, self.password)
@@ -214,6 +312,28 @@ class EmailReader:
                         f"Failed to connect after {self.max_retries} attempts: {e}"
                     ) from e
 
+    def ensure_connected(self) -> None:
+        """
+        Make sure the IMAP connection is alive, reconnecting if it dropped.
+
+        An existing connection is pinged with NOOP; if the server closed it
+        (idle timeout, network drop), a fresh connection is opened.
+
+        Raises:
+            EmailConnectionError: If reconnecting fails after max retries
+        """
+        if self.connection:
+            try:
+                result, _ = self.connection.noop()
+                if result == "OK":
+                    return
+                logger.info(f"IMAP NOOP returned {result}, reconnecting")
+            except (imaplib.IMAP4.abort, OSError) as e:
+                logger.info(f"IMAP connection dropped ({e}), reconnecting")
+            self.connection = None
+
+        self.connect()
+
     def disconnect(self) -> None:
         """Safely disconnect from IMAP server."""
         if self.connection:
@@ -245,7 +365,9 @@ class EmailReader:
         if result != "OK":
             raise EmailConnectionError(f"Failed to select mailbox {mailbox}: {data}")
 
+        self.mailbox = mailbox
         message_count = int(data[0]) if data and data[0] else 0
+        self.message_count = message_count
         logger.info(f"Selected mailbox '{mailbox}' with {message_count} messages")
 
         return result, message_count
@@ -286,6 +408,17 @@ class EmailReader:
         if search_parts:
             criteria = " ".join(search_parts)
 
+        # UNSEEN results change as soon as messages are fetched, so skip them
+        cacheable = self.search_cache_ttl > 0 and "UNSEEN" not in criteria
+        if cacheable:
+            self._refresh_search_cache()
+        cache_key = (self.mailbox, self.message_count, criteria)
+        if cacheable:
+            cached = self._search_cache.get(cache_key)
+            if cached and time.monotonic() - cached[1] < self.search_cache_ttl:
+                logger.debug(f"Reusing cached search results for: {criteria}")
+                return list(cached[0])
+
         logger.debug(f"Searching emails with criteria: {criteria}")
 
         result, data = self.connection.search(None, criteria)
@@ -296,7 +429,24 @@ class EmailReader:
         uids = data[0].decode().split() if data[0] else []
         logger.info(f"Found {len(uids)} emails matching criteria")
 
-        return uids
+        if cacheable:
+            self._search_cache[cache_key] = (uids, time.monotonic())
+
+        return list(uids)
+
+    def _refresh_search_cache(self) -> None:
+        """Drop cached searches once the server reports new or expunged mail."""
+        _, expunged = self.connection.response("EXPUNGE")
+        if expunged and expunged[-1] is not None:
+            self._search_cache.clear()
+
+        # Untagged EXISTS announces mail that arrived since SELECT
+        _, exists = self.connection.response("EXISTS")
+        if exists and exists[-1] is not None:
+            message_count = int(exists[-1])
+            if message_count != self.message_count:
+                self.message_count = message_count
+                self._search_cache.clear()
 
     def fetch_email(self, uid: str) -> dict[str, Any] | None:
         """
@@ -323,7 +473,7 @@ class EmailReader:
             if not isinstance(raw_data, bytes | bytearray):
                 logger.warning(f"Invalid email data type for UID {uid}")
                 return None
-            email_message = email.message_from_bytes(raw_data)
+            email_message = _parse_bytes(raw_data)
 
             return self._parse_email_message(email_message, uid)
 
@@ -358,16 +508,310 @@ class EmailReader:
         if limit and len(uids) > limit:
             uids = uids[-limit:]  # Get most recent emails
 
-        # Fetch and parse emails
+        return self._fetch_uids(uids)
+
+    def search_newsletters(self, since_date: datetime | None = None) -> list[str]:
+        """
+        Search server-side for newsletter candidates by mailing-list headers.
+
+        Matches messages carrying a List-Unsubscribe or List-Id header. These
+        are only candidates: notifications and receipts carry the same
+        headers, so _is_newsletter still decides what is kept.
+
+        Args:
+            since_date: Only return newsletters since this date
+
+        Returns:
+            List of email UIDs
+        """
+        criteria = 'OR HEADER List-Unsubscribe "" HEADER List-Id ""'
+        if since_date:
+            criteria = f"SINCE {since_date.strftime('%d-%b-%Y')} {criteria}"
+
+        return self.search_emails(criteria=criteria)
+
+    def fetch_headers(self, uids: list[str]) -> list[dict[str, Any]]:
+        """
+        Fetch only the headers needed to identify and rank newsletters.
+
+        Bodies are not downloaded and messages are not marked as read.
+        The returned dictionaries have empty content fields but carry
+        ``is_newsletter`` and ``newsletter_type`` so they can go straight
+        into filter_newsletters().
+
+        Args:
+            uids: Email UIDs to fetch
+
+        Returns:
+            List of header-only email dictionaries
+        """
+        return self._fetch_uids(uids, *self._fetch_mode(headers_only=True))
+
+    def fetch_bodies(self, uids: list[str]) -> list[dict[str, Any]]:
+        """
+        Fetch and parse full messages without marking them as read.
+
+        Args:
+            uids: Email UIDs to fetch
+
+        Returns:
+            List of parsed email dictionaries
+        """
+        return self._fetch_uids(uids, "(BODY.PEEK[])")
+
+    def fetch_emails_parallel(
+        self, uids: list[str], workers: int = 3, headers_only: bool = False
+    ) -> list[dict[str, Any]]:
+        """
+        Fetch emails over several IMAP connections at once.
+
+        The UID list is split into contiguous ranges and each range is
+        fetched on its own connection to the currently selected mailbox,
+        so round trips overlap instead of queueing on one socket.
+
+        Args:
+            uids: Email UIDs to fetch
+            workers: Number of parallel connections to open
+            headers_only: Fetch only headers, as fetch_headers() does
+
+        Returns:
+            List of parsed email dictionaries, in UID order
+        """
+        if workers <= 1 or len(uids) <= 1:
+            return self._fetch_uids(uids, *self._fetch_mode(headers_only))
+
+        chunk_size = -(-len(uids) // workers)  # Ceiling division
+        chunks = [
+            uids[start : start + chunk_size]
+            for start in range(0, len(uids), chunk_size)
+        ]
+
+        with ThreadPoolExecutor(max_workers=len(chunks)) as executor:
+            results = executor.map(
+                self._fetch_on_new_connection, chunks, [headers_only] * len(chunks)
+            )
+            emails = [email_data for chunk in results for email_data in chunk]
+
+        logger.info(
+            f"Fetched {len(emails)} emails over {len(chunks)} parallel connections"
+        )
+        return emails
+
+    def _fetch_mode(
+        self, headers_only: bool
+    ) -> tuple[str, Callable[[Message, str], dict[str, Any]]]:
+        """
+        Pick FETCH data items and parser for a full or header-only fetch.
+
+        Args:
+            headers_only: Fetch only headers, leaving bodies on the server
+
+        Returns:
+            Tuple of (message_parts, parse) for _fetch_uids()
+        """
+        if headers_only:
+            return (
+                f"(BODY.PEEK[HEADER.FIELDS ({_HEADER_FIELDS})])",
+                self._parse_email_headers,
+            )
+        return "(RFC822)", self._parse_email_message
+
+    def _fetch_on_new_connection(
+        self, uids: list[str], headers_only: bool = False
+    ) -> list[dict[str, Any]]:
+        """
+        Fetch emails on a dedicated connection to the selected mailbox.
+
+        Args:
+            uids: Email UIDs to fetch
+            headers_only: Fetch only headers, leaving bodies on the server
+
+        Returns:
+            List of parsed email dictionaries
+        """
+        worker = EmailReader(
+            imap_server=self.imap_server,
+            imap_port=self.imap_port,
+            email_address=self.email_address,
+            password=self.password,
+            max_retries=self.max_retries,
+            retry_delay=self.retry_delay,
+            fetch_batch_size=self.fetch_batch_size,
+        )
+        worker.newsletter_patterns = self.newsletter_patterns
+        with worker:
+            worker.select_mailbox(self.mailbox)
+            return worker._fetch_uids(uids, *worker._fetch_mode(headers_only))
+
+    def _fetch_uids(
+        self,
+        uids: list[str],
+        message_parts: str = "(RFC822)",
+        parse: Callable[[Message, str], dict[str, Any]] | None = None,
+    ) -> list[dict[str, Any]]:
+        """
+        Fetch and parse emails, one FETCH command per batch of UIDs.
+
+        Each batch is parsed on a helper thread while the next FETCH is
+        in flight, so client-side parsing overlaps server latency.
+
+        Args:
+            uids: Email UIDs to fetch
+            message_parts: IMAP FETCH data items to request
+            parse: Parser for each message (defaults to a full parse)
+
+        Returns:
+            List of parsed email dictionaries
+        """
+        batches = [
+            uids[start : start + self.fetch_batch_size]
+            for start in range(0, len(uids), self.fetch_batch_size)
+        ]
+
         emails = []
-        for uid in uids:
-            email_data = self.fetch_email(uid)
-            if email_data:
-                emails.append(email_data)
+        if len(batches) <= 1:
+            for batch in batches:
+                emails.extend(self._fetch_batch(batch, message_parts, parse))
+        else:
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                pending = [
+                    executor.submit(
+                        self._parse_batch,
+                        self._fetch_raw_batch(batch, message_parts),
+                        parse,
+                    )
+                    for batch in batches
+                ]
+                for future in pending:
+                    emails.extend(future.result())
 
         logger.info(f"Successfully fetched {len(emails)} emails")
         return emails
 
+    def _fetch_batch(
+        self,
+        uids: list[str],
+        message_parts: str = "(RFC822)",
+        parse: Callable[[Message, str], dict[str, Any]] | None = None,
+    ) -> list[dict[str, Any]]:
+        """
+        Fetch and parse several emails with a single FETCH command.
+
+        Args:
+            uids: Email UIDs to fetch
+            message_parts: IMAP FETCH data items to request
+            parse: Parser for each message (defaults to a full parse)
+
+        Returns:
+            List of parsed email dictionaries (failed emails are skipped)
+        """
+        return self._parse_batch(self._fetch_raw_batch(uids, message_parts), parse)
+
+    def _fetch_raw_batch(
+        self, uids: list[str], message_parts: str = "(RFC822)"
+    ) -> list[Any]:
+        """
+        Issue a single FETCH command for several emails.
+
+        Args:
+            uids: Email UIDs to fetch
+            message_parts: IMAP FETCH data items to request
+
+        Returns:
+            Raw FETCH response items (empty if the command failed)
+        """
+        if not self.connection:
+            raise EmailConnectionError("No active IMAP connection")
+
+        if not uids:
+            return []
+
+        result, data = self.connection.fetch(",".join(uids), message_parts)
+        if result != "OK" or not data:
+            logger.warning(f"Failed to fetch {len(uids)} emails: {data}")
+            return []
+
+        return list(data)
+
+    def _parse_batch(
+        self,
+        data: list[Any],
+        parse: Callable[[Message, str], dict[str, Any]] | None = None,
+    ) -> list[dict[str, Any]]:
+        """
+        Parse the messages in a raw FETCH response.
+
+        Args:
+            data: Raw FETCH response items
+            parse: Parser for each message (defaults to a full parse)
+
+        Returns:
+            List of parsed email dictionaries (failed emails are skipped)
+        """
+        parse = parse or self._parse_email_message
+
+        # Response interleaves (b"<uid> (RFC822 {size}", raw) tuples with b")"
+        emails = []
+        for item in data:
+            if not isinstance(item, tuple):
+                continue
+
+            header, raw_data = item
+            uid = header.split()[0].decode()
+            try:
+                email_message = _parse_bytes(raw_data)
+                emails.append(parse(email_message, uid))
+            except Exception as e:
+                logger.error(f"Error parsing email UID {uid}: {e}")
+
+        return emails
+
+    def _extract_header_data(
+        self, message: EmailMessage | Message, uid: str
+    ) -> dict[str, Any]:
+        """
+        Build email data from message headers, with empty content fields.
+
+        Args:
+            message: Email message object
+            uid: Email UID
+
+        Returns:
+            Dictionary with decoded header metadata
+        """
+        return {
+            "uid": uid,
+            "subject": decode_mime_header(message.get("Subject", "")),
+            "sender": decode_mime_header(message.get("From", "")),
+            "date": str(message.get("Date", "")),
+            "content_type": "",
+            "body": "",
+            "text_content": "",
+            "html_content": "",
+            "is_newsletter": False,
+            "newsletter_type": "",
+            "message_id": str(message.get("Message-ID", "")),
+        }
+
+    def _parse_email_headers(self, message: Message, uid: str) -> dict[str, Any]:
+        """
+        Parse a header-only message into email data without content.
+
+        Args:
+            message: Message holding only header fields
+            uid: Email UID
+
+        Returns:
+            Dictionary with email metadata and newsletter classification
+        """
+        email_data = self._extract_header_data(message, uid)
+
+        email_data["is_newsletter"] = self._is_newsletter(email_data)
+        if email_data["is_newsletter"]:
+            email_data["newsletter_type"] = self._classify_newsletter(email_data)
+
+        return email_data
+
     def _parse_email_message(
         self, message: EmailMessage | Message, uid: str
     ) -> dict[str, Any]:
@@ -386,19 +830,7 @@ class EmailReader:
         """
         try:
             # Extract basic metadata with proper decoding
-            email_data = {
-                "uid": uid,
-                "subject": decode_mime_header(message.get("Subject", "")),
-                "sender": decode_mime_header(message.get("From", "")),
-                "date": message.get("Date", ""),
-                "content_type": "",
-                "body": "",
-                "text_content": "",
-                "html_content": "",
-                "is_newsletter": False,
-                "newsletter_type": "",
-                "message_id": message.get("Message-ID", ""),
-            }
+            email_data = self._extract_header_data(message, uid)
 
             # Extract body content
             if message.is_multipart():
@@ -481,10 +913,12 @@ class EmailReader:
             if domain in sender:
                 return True
 
-        # Check subject patterns
-        for pattern in self.newsletter_patterns["subject_patterns"]:
-            if re.search(pattern, subject, re.IGNORECASE):
-                return True
+        # Check subject patterns (fused into one regex, compiled once)
+        subject_re = _compile_alternation(
+            tuple(self.newsletter_patterns["subject_patterns"])
+        )
+        if subject_re.search(subject):
+            return True
 
         # Additional heuristics
         body_lower = email_data["text_content"].lower()
@@ -513,33 +947,15 @@ class EmailReader:
         Returns:
             Newsletter type classification
         """
-        subject = email_data["subject"].lower()
-        sender = email_data["sender"].lower()
+        # NUL never occurs in keywords, so no match can span both fields
+        text = f"{email_data['subject']}\x00{email_data['sender']}".lower()
+        match = _NEWSLETTER_TYPE_RE.match(text)
 
-        # Technology newsletters
-        tech_keywords = [
-            "ai",
-            "tech",
-            "engineering",
-            "software",
-            "coding",
-            "developer",
-            "startup",
-        ]
-        if any(keyword in subject or keyword in sender for keyword in tech_keywords):
-            return "technology"
-
-        # Business/Finance newsletters
-        business_keywords = ["business", "finance", "market", "economy", "investment"]
-        if any(
-            keyword in subject or keyword in sender for keyword in business_keywords
-        ):
-            return "business"
-
-        # News newsletters
-        news_keywords = ["news", "daily", "breaking", "update", "headlines"]
-        if any(keyword in subject or keyword in sender for keyword in news_keywords):
-            return "news"
+        # match() always succeeds; pick the highest-priority type found
+        matched = match.groupdict() if match else {}
+        for newsletter_type in NEWSLETTER_TYPE_KEYWORDS:
+            if matched.get(newsletter_type):
+                return newsletter_type
 
         return "general"
 
@@ -597,16 +1013,28 @@ class EmailReader:
         # Select inbox
         self.select_mailbox("INBOX")
 
-        # Fetch emails
-        emails = self.fetch_emails(
-            limit=(limit * 2) if limit else None,  # Fetch more to account for filtering
-            since_date=since_date,
+        # Let the server pick out mailing-list mail as candidates, plus the most
+        # recent mail in the window (as before) for newsletters sent without
+        # List-* headers. Classification below stays with _is_newsletter
+        recent = self.search_emails(since_date=since_date)
+        if limit:
+            recent = recent[-limit * 2 :]
+        uids = sorted(
+            set(self.search_newsletters(since_date=since_date)).union(recent), key=int
         )
 
-        # Filter for newsletters
-        newsletters = self.filter_newsletters(emails)
+        # Rank on headers alone: header-confirmed newsletters first, then mail
+        # that only its body can confirm. Body cues are unseen at this point,
+        # so over-fetch (as before) rather than cutting to the limit here
+        headers = self.fetch_headers(uids)
+        candidates = self.filter_newsletters(headers)
+        candidates += [email for email in headers if not email["is_newsletter"]]
+        if limit:
+            candidates = candidates[: limit * 2]
 
-        # Apply final limit
+        # Download bodies only for those candidates, then classify and cut
+        emails = self.fetch_bodies([candidate["uid"] for candidate in candidates])
+        newsletters = self.filter_newsletters(emails)
         if limit:
             newsletters = newsletters[:limit]
 
@@ -651,9 +1079,7 @@ class EmailReader:
             return "unknown@unknown.com"
 
         # Extract email address from "Name <email@domain.com>" format
-        import re
-
-        email_match = re.search(r"<([^>]+)>", sender)
+        email_match = _ANGLE_ADDRESS_RE.search(sender)
         if email_match:
             return email_match.group(1).strip()
 
@@ -696,14 +1122,16 @@ class EmailReader:
             content=content.strip(),
             source=clean_source,
             date=email_data.get("date", ""),
-            metadata={
-                "uid": email_data.get("uid", ""),
-                "message_id": email_data.get("message_id", ""),
-                "is_newsletter": email_data.get("is_newsletter", False),
-                "newsletter_type": email_data.get("newsletter_type", "general"),
-                "content_type": email_data.get("content_type", "text/plain"),
-            },
-            links=links if links else None,
+            metadata=MappingProxyType(
+                {
+                    "uid": email_data.get("uid", ""),
+                    "message_id": email_data.get("message_id", ""),
+                    "is_newsletter": email_data.get("is_newsletter", False),
+                    "newsletter_type": email_data.get("newsletter_type", "general"),
+                    "content_type": email_data.get("content_type", "text/plain"),
+                }
+            ),
+            links=tuple(links) if links else None,
         )
 
     def get_recent_newsletters_as_content(
@@ -5,20 +5,67 @@ This module tracks processing failures and maintains a backlog
 for future improvement and debugging.
 """
 
+import itertools
 import logging
+import sys
+import threading
+from collections import Counter, deque
+from collections.abc import Mapping
+from dataclasses import asdict, dataclass
 from datetime import datetime
+from types import MappingProxyType
 from typing import Any
 
 logger = logging.getLogger(__name__)
 
+# Oldest entries are dropped once the backlog holds this many errors
+BACKLOG_MAX = 1000
+
+# Number of most recent errors reported by get_error_stats()
+RECENT_ERRORS = 10
+
+# Names of the exception types processing usually fails with, resolved once
+_COMMON_ERROR_TYPES = {
+    error_class: sys.intern(error_class.__name__)
+    for error_class in (
+        Exception,
+        ValueError,
+        KeyError,
+        TypeError,
+        RuntimeError,
+        ConnectionError,
+        TimeoutError,
+    )
+}
+
+
+@dataclass(slots=True)
+class ErrorEntry:
+    """A single failed processing attempt held in the backlog."""
+
+    newsletter_title: str
+    error_type: str
+    error_message: str
+    timestamp: str
+    retry_count: int = 0  # For future retry functionality
+
 
 class ErrorTracker:
     """Tracks errors and maintains a backlog of failed processing attempts."""
 
-    def __init__(self) -> None:
-        """Initialize error tracker with empty state."""
-        self._errors: list[dict[str, Any]] = []
-        self._error_counts: dict[str, int] = {}
+    __slots__ = ("_backlog", "_total_errors", "_error_counts", "_lock")
+
+    def __init__(self, backlog_max: int = BACKLOG_MAX) -> None:
+        """
+        Initialize error tracker with empty state.
+
+        Args:
+            backlog_max: Maximum number of error entries kept in the backlog
+        """
+        self._backlog: deque[ErrorEntry] = deque(maxlen=backlog_max)
+        self._total_errors = 0
+        self._error_counts: Counter[str] = Counter()
+        self._lock = threading.Lock()
 
     def record_error(self, newsletter_title: str, error: Exception) -> None:
         """
@@ -28,30 +75,69 @@ class ErrorTracker:
             newsletter_title: Title of the newsletter that failed
             error: Exception that occurred during processing
         """
-        error_entry = {
-            "newsletter_title": newsletter_title,
-            "error_type": type(error).__name__,
-            "error_message": str(error),
-            "timestamp": datetime.now().isoformat(),
-            "retry_count": 0,  # For future retry functionality
-        }
-
-        self._errors.append(error_entry)
+        self.record_many([(newsletter_title, error)])
 
-        # Update error type counts
-        error_type = str(error_entry["error_type"])
-        self._error_counts[error_type] = self._error_counts.get(error_type, 0) + 1
+    def record_many(self, errors: list[tuple[str, Exception]]) -> None:
+        """
+        Record several processing errors under a single lock acquisition.
 
-        logger.error(f"Recorded error for '{newsletter_title}': {error}")
+        Args:
+            errors: List of (newsletter_title, error) pairs
+        """
+        # Errors recorded together share one timestamp, formatted once
+        timestamp = datetime.now().isoformat()
+
+        # Build entries outside the lock so the critical section stays short
+        error_entries = [
+            ErrorEntry(
+                # Titles and type names repeat across retries; share one copy
+                newsletter_title=sys.intern(str(newsletter_title)),
+                error_type=_COMMON_ERROR_TYPES.get(type(error))
+                or sys.intern(type(error).__name__),
+                error_message=str(error),
+                timestamp=timestamp,
+            )
+            for newsletter_title, error in errors
+        ]
+
+        with self._lock:
+            self._backlog.extend(error_entries)
+            self._total_errors += len(error_entries)
+
+            # Keep per-type counts current so stats never rescan the backlog
+            self._error_counts.update(entry.error_type for entry in error_entries)
+
+        for newsletter_title, error in errors:
+            logger.error(f"Recorded error for '{newsletter_title}': {error}")
 
     def get_backlog(self) -> list[dict[str, Any]]:
         """
         Get the backlog of failed processing attempts.
 
+        Only the most recent backlog_max entries are kept.
+
         Returns:
             List of error entries with details
         """
-        return self._errors.copy()
+        with self._lock:
+            return [asdict(entry) for entry in self._backlog]
+
+    def has_error_for(self, newsletter_title: str) -> bool:
+        """
+        Check whether the backlog holds an error for a newsletter.
+
+        Unlike get_backlog(), entries are scanned in place without copying.
+
+        Args:
+            newsletter_title: Title the error was recorded under
+
+        Returns:
+            True if at least one backlog entry has this title
+        """
+        with self._lock:
+            return any(
+                entry.newsletter_title == newsletter_title for entry in self._backlog
+            )
 
     def get_error_stats(self) -> dict[str, Any]:
         """
@@ -60,16 +146,33 @@ class ErrorTracker:
         Returns:
             Dictionary containing error statistics
         """
-        return {
-            "total_errors": len(self._errors),
-            "error_types": self._error_counts.copy(),
-            "recent_errors": (
-                self._errors[-10:] if self._errors else []
-            ),  # Last 10 errors
-        }
+        with self._lock:
+            start = max(0, len(self._backlog) - RECENT_ERRORS)
+            return {
+                "total_errors": self._total_errors,
+                "error_types": dict(self._error_counts),
+                "recent_errors": [
+                    asdict(entry)
+                    for entry in itertools.islice(self._backlog, start, None)
+                ],
+            }
+
+    def error_types_view(self) -> Mapping[str, int]:
+        """
+        Get a live, read-only view of error counts by exception type.
+
+        Unlike get_error_stats(), nothing is copied; the view reflects
+        errors recorded after it was created.
+
+        Returns:
+            Mapping of error type name to number of recorded errors
+        """
+        return MappingProxyType(self._error_counts)
 
     def clear_backlog(self) -> None:
         """Clear the error backlog and reset statistics."""
-        self._errors.clear()
-        self._error_counts.clear()
+        with self._lock:
+            self._backlog.clear()
+            self._total_errors = 0
+            self._error_counts.clear()
         logger.info("Error backlog cleared")
@@ -5,22 +5,24 @@ These models provide a clean interface for processors,
 decoupled from email structure complexity.
 """
 
-from dataclasses import dataclass
+from collections.abc import Mapping
+from dataclasses import dataclass, field
 from typing import Any
 
 from src.senders.models import EmailData
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class NewsletterContent:
-    """Decoupled newsletter content structure."""
+    """Decoupled newsletter content structure (immutable and hashable)."""
 
     title: str
     content: str
     source: str
     date: str
-    metadata: dict[str, Any]
-    links: list[str] | None = None  # URLs extracted from newsletter content
+    # May be a read-only MappingProxyType view; left out of the hash
+    metadata: Mapping[str, Any] = field(hash=False)
+    links: tuple[str, ...] | None = None  # URLs extracted from newsletter content
 
     def __post_init__(self) -> None:
         """Validate newsletter content after initialization."""
@@ -34,7 +36,7 @@ class NewsletterContent:
             raise ValueError("Date is required")
 
 
-@dataclass
+@dataclass(slots=True)
 class ProcessingResult:
     """Result of newsletter processing operation."""
 
@@ -53,3 +55,7 @@ class ProcessingResult:
             raise ValueError("Successful processing must have email_data")
         if not self.success and not self.errors:
             raise ValueError("Failed processing must have error messages")
+
+    def has_error(self, text: str) -> bool:
+        """Check whether any error message contains the given text."""
+        return any(text in error for error in self.errors or ())
@@ -5,8 +5,13 @@ This module handles the core processing logic, converting newsletter content
 into formatted emails ready for sending.
 """
 
+import functools
+import hashlib
 import logging
+from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from types import MappingProxyType
 from typing import Any
 
 from src.processors.error_tracker import ErrorTracker
@@ -18,14 +23,90 @@ from src.utils.config import Config
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on concurrent summarizer calls in the individual fallback
+MAX_SUMMARY_WORKERS = 8
+
+# Errors reported when process_newsletters() is called with nothing to do
+_EMPTY_INPUT_ERRORS = ("No newsletters to process",)
+
+# Subject line of the digest email
+_SUBJECT_TEMPLATE = "📧 Daily Newsletter Summary - {date}"
+
+# Static pieces of the structured summary, built once at import
+_HIGHLIGHTS_HEADING = "\n🎯 Today's Highlights\n\n"
+_CATEGORIES_HEADING = "\n📂 Category Breakdown\n\n"
+_SECTION_RULE = f"\n{'=' * 60}\n"
+_CATEGORY_RULE = f"{'─' * 40}\n\n"
+
+# Category emoji and English name, keyed by summary category
+_CATEGORY_LABELS = {
+    "technology": "🚀 Technology",
+    "tech_innovation": "🚀 Technology",  # backward compatibility
+    "business": "💰 Business",
+    "business_finance": "💰 Business",  # backward compatibility
+    "industry_trends": "📈 Industry Trends",
+    "tools_resources": "🔧 Tools & Resources",
+    "general": "📰 General",  # fallback category
+}
+
+# Priority marker shown after each category label
+_PRIORITY_MARKS = {"high": "🔴", "medium": "🟡", "low": "🟢"}
+
+
+@functools.lru_cache(maxsize=128)
+def _render_summary_sections(
+    highlights: tuple[str, ...],
+    categories: tuple[tuple[str, str, str, tuple[str, ...]], ...],
+) -> str:
+    """
+    Render the highlights and category sections of a structured summary.
+
+    Args:
+        highlights: Daily highlight lines, in order
+        categories: (category_key, priority, summary, items) per category
+
+    Returns:
+        Highlights section followed by the category breakdown
+    """
+    # Daily highlights section
+    parts = [_HIGHLIGHTS_HEADING]
+    parts.extend(f"{i}. {highlight}\n" for i, highlight in enumerate(highlights, 1))
+    parts.append(_SECTION_RULE)
+
+    # Categories section
+    parts.append(_CATEGORIES_HEADING)
+
+    for category_key, priority, summary, items in categories:
+        label = _CATEGORY_LABELS.get(category_key) or f"📰 {category_key}"
+        priority_emoji = _PRIORITY_MARKS.get(priority, "🟡")
+
+        parts.append(f"{label} {priority_emoji}\n")
+        parts.append(f"{summary}\n\n")
+
+        # Add items if available
+        if items:
+            parts.append("Key Items:\n")
+            parts.extend(f"• {item}\n" for item in items)  # Limited to 5 by caller
+            parts.append("\n")
+
+        parts.append(_CATEGORY_RULE)
+
+    return "".join(parts)
+
 
 class NewsletterProcessor:
     """Main processor for converting newsletters to email format."""
 
-    def __init__(self, config: Config) -> None:
-        """Initialize processor with dependencies."""
+    def __init__(self, config: Config, summarizer: Summarizer | None = None) -> None:
+        """
+        Initialize processor with dependencies.
+
+        Args:
+            config: Application configuration
+            summarizer: Summarizer to use (defaults to one built from config)
+        """
         self.config = config
-        self.summarizer = Summarizer(config)
+        self.summarizer = summarizer or Summarizer(config)
         self.error_tracker = ErrorTracker()
         self.html_formatter = HTMLFormatter()
         logger.debug("NewsletterProcessor initialized with HTML support")
@@ -46,11 +127,14 @@ class NewsletterProcessor:
             logger.warning("No newsletters provided for processing")
             return ProcessingResult(
                 success=False,
-                errors=["No newsletters to process"],
+                errors=list(_EMPTY_INPUT_ERRORS),
                 processed_count=0,
                 failed_count=0,
             )
 
+        # Skip newsletters republishing content we already have in this run
+        newsletters, deduped_count = self._deduplicate(newsletters)
+
         processed_count = len(newsletters)
         failed_count = 0
         errors = []
@@ -71,8 +155,8 @@ class NewsletterProcessor:
             )
 
         except Exception as e:
-            # Record error and use individual processing as fallback
-            self.error_tracker.record_error("AI_BATCH_PROCESSING", e)
+            # Buffer the error with any fallback failures; recorded once below
+            tracked_errors: list[tuple[str, Exception]] = [("AI_BATCH_PROCESSING", e)]
             errors.append(f"AI batch processing failed: {str(e)}, using fallback")
             logger.error(
                 f"AI batch processing failed: {e}, falling back to individual processing"
@@ -84,25 +168,24 @@ class NewsletterProcessor:
             processed_count = 0
             failed_count = 0
 
-            for newsletter in newsletters:
-                try:
-                    # Summarize content individually
-                    summary = self.summarizer.summarize(newsletter.content)
-
-                    # Format newsletter section
-                    formatted_section = self._format_newsletter_section(
-                        newsletter.title, summary, newsletter.source
+            # Summaries are independent API calls, so overlap their latency
+            with ThreadPoolExecutor(
+                max_workers=min(MAX_SUMMARY_WORKERS, len(newsletters))
+            ) as executor:
+                results = list(
+                    executor.map(
+                        self._safe_summarize,
+                        [newsletter.content for newsletter in newsletters],
                     )
+                )
 
-                    processed_content.append(formatted_section)
-                    processed_sources.append(newsletter.source)
-                    processed_count += 1
-
-                    logger.debug(f"Successfully processed: {newsletter.title}")
-
-                except Exception as individual_error:
-                    # Record error and continue with other newsletters
-                    self.error_tracker.record_error(newsletter.title, individual_error)
+            # Collect results in input order so the digest order is stable
+            for newsletter, (summary, individual_error) in zip(
+                newsletters, results, strict=True
+            ):
+                if individual_error is not None:
+                    # Collect error and continue with other newsletters
+                    tracked_errors.append((newsletter.title, individual_error))
                     errors.append(
                         f"Failed to process '{newsletter.title}': {str(individual_error)}"
                     )
@@ -111,6 +194,21 @@ class NewsletterProcessor:
                     logger.error(
                         f"Failed to process '{newsletter.title}': {individual_error}"
                     )
+                    continue
+
+                # Format newsletter section
+                formatted_section = self._format_newsletter_section(
+                    newsletter.title, str(summary), newsletter.source
+                )
+
+                processed_content.append(formatted_section)
+                processed_sources.append(newsletter.source)
+                processed_count += 1
+
+                logger.debug(f"Successfully processed: {newsletter.title}")
+
+            # Record the batch failure and all individual failures in one flush
+            self.error_tracker.record_many(tracked_errors)
 
             # Check if we have any successful processing
             if processed_count == 0:
@@ -167,10 +265,14 @@ class NewsletterProcessor:
         # Create EmailData with HTML support
         email_data = EmailData(
             recipient=recipient,
-            subject=f"📧 Daily Newsletter Summary - {friendly_date}",
+            subject=_SUBJECT_TEMPLATE.format(date=friendly_date),
             content=final_content,
             metadata=self._create_metadata(
-                newsletters[0].date, processed_sources, processed_count, failed_count
+                newsletters[0].date,
+                processed_sources,
+                processed_count,
+                failed_count,
+                deduped_count,
             ),
             html_content=html_content if "html_content" in locals() else None,
         )
@@ -187,6 +289,59 @@ class NewsletterProcessor:
             failed_count=failed_count,
         )
 
+    def _safe_summarize(self, content: str) -> tuple[str | None, Exception | None]:
+        """
+        Summarize content, returning a failure instead of raising it.
+
+        Args:
+            content: Newsletter content to summarize
+
+        Returns:
+            Tuple of (summary, None) on success or (None, error) on failure
+        """
+        try:
+            return self.summarizer.summarize(content), None
+        except Exception as e:
+            return None, e
+
+    def _deduplicate(
+        self, newsletters: list[NewsletterContent]
+    ) -> tuple[list[NewsletterContent], int]:
+        """
+        Drop newsletters whose content duplicates an earlier one.
+
+        Content is fingerprinted with BLAKE2b after collapsing whitespace and
+        case, so the same article republished by several sources is only
+        summarized once.
+
+        Args:
+            newsletters: Newsletters to deduplicate, in order
+
+        Returns:
+            Tuple of (unique newsletters, number of duplicates dropped)
+        """
+        seen: set[bytes] = set()
+        unique = []
+
+        for newsletter in newsletters:
+            normalized = " ".join(newsletter.content.split()).casefold()
+            fingerprint = hashlib.blake2b(
+                normalized.encode("utf-8"), digest_size=16
+            ).digest()
+
+            if fingerprint in seen:
+                logger.debug(f"Skipping duplicate newsletter: {newsletter.title}")
+                continue
+
+            seen.add(fingerprint)
+            unique.append(newsletter)
+
+        deduped_count = len(newsletters) - len(unique)
+        if deduped_count:
+            logger.info(f"Skipped {deduped_count} duplicate newsletters")
+
+        return unique, deduped_count
+
     def _format_newsletter_section(self, title: str, content: str, source: str) -> str:
         """Format a single newsletter into a section."""
         return f"""
@@ -210,44 +365,22 @@ class NewsletterProcessor:
 {'=' * 60}
 """
 
-        # Daily highlights section
-        highlights_content = "\n🎯 Today's Highlights\n\n"
-        for i, highlight in enumerate(summary_data.get("daily_highlights", []), 1):
-            highlights_content += f"{i}. {highlight}\n"
-        highlights_content += f"\n{'=' * 60}\n"
-
-        # Categories section
-        categories_content = "\n📂 Category Breakdown\n\n"
-        categories = summary_data.get("categories", {})
-
-        # Define category emojis and English names
-        category_info = {
-            "technology": ("🚀", "Technology"),
-            "tech_innovation": ("🚀", "Technology"),  # backward compatibility
-            "business": ("💰", "Business"),
-            "business_finance": ("💰", "Business"),  # backward compatibility
-            "industry_trends": ("📈", "Industry Trends"),
-            "tools_resources": ("🔧", "Tools & Resources"),
-            "general": ("📰", "General"),  # fallback category
-        }
-
-        for category_key, category_data in categories.items():
-            emoji, english_name = category_info.get(category_key, ("📰", category_key))
-            priority_emoji = {"high": "🔴", "medium": "🟡", "low": "🟢"}.get(
-                category_data.get("priority", "medium"), "🟡"
+        # Highlights and categories depend only on the summary, so reuse them
+        highlights = tuple(
+            str(highlight) for highlight in summary_data.get("daily_highlights", [])
+        )
+        categories = tuple(
+            (
+                category_key,
+                str(category_data.get("priority", "medium")),
+                str(category_data.get("summary", "")),
+                tuple(str(item) for item in (category_data.get("items") or [])[:5]),
             )
-
-            categories_content += f"{emoji} {english_name} {priority_emoji}\n"
-            categories_content += f"{category_data.get('summary', '')}\n\n"
-
-            # Add items if available
-            if category_data.get("items"):
-                categories_content += "Key Items:\n"
-                for item in category_data["items"][:5]:  # Limit display quantity
-                    categories_content += f"• {item}\n"
-                categories_content += "\n"
-
-            categories_content += f"{'─' * 40}\n\n"
+            for category_key, category_data in summary_data.get(
+                "categories", {}
+            ).items()
+        )
+        sections = _render_summary_sections(highlights, categories)
 
         # Footer
         footer = f"""
@@ -259,7 +392,7 @@ class NewsletterProcessor:
 🤖 This summary was automatically generated by Good Morning Agent using AI technology
 """
 
-        return header + highlights_content + categories_content + footer
+        return "".join((header, sections, footer))
 
     def _combine_content(self, sections: list[str]) -> str:
         """Combine multiple newsletter sections into final content (fallback method)."""
@@ -280,16 +413,24 @@ Today's digest includes {len(sections)} newsletters with the following summaries
 This summary was automatically generated by Good Morning Agent.
 """
 
-        return header + "\n".join(sections) + footer
+        return "".join((header, "\n".join(sections), footer))
 
     def _create_metadata(
-        self, date: str, sources: list[str], processed_count: int, failed_count: int
-    ) -> dict[str, Any]:
-        """Create metadata for the email."""
-        return {
-            "date": date,
-            "sources": sources,
-            "processed_count": processed_count,
-            "failed_count": failed_count,
-            "processor_version": "1.0.0",
-        }
+        self,
+        date: str,
+        sources: list[str],
+        processed_count: int,
+        failed_count: int,
+        deduped_count: int = 0,
+    ) -> Mapping[str, Any]:
+        """Create read-only metadata for the email, shared without copying."""
+        return MappingProxyType(
+            {
+                "date": date,
+                "sources": sources,
+                "processed_count": processed_count,
+                "failed_count": failed_count,
+                "deduped_count": deduped_count,
+                "processor_version": "1.0.0",
+            }
+        )
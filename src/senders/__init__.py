@@ -7,7 +7,7 @@ and proper error handling.
 
 from .email_sender import EmailSender
 from .message_formatter import MessageFormatter
-from .models import EmailData, SendResult
+from .models import BatchResult, EmailData, SendResult
 from .security_manager import SecurityManager
 
 __all__ = [
@@ -16,4 +16,5 @@ __all__ = [
     "SecurityManager",
     "EmailData",
     "SendResult",
+    "BatchResult",
 ]
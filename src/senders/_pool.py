@@ -0,0 +1,145 @@
+"""
+Shared SMTP connection pool for EmailSender instances.
+
+Senders for the same account hand their authenticated connection back
+here after each message instead of quitting, so the next send skips the
+TLS handshake and AUTH round trips. Idle connections are closed with QUIT
+when the interpreter exits.
+"""
+
+import atexit
+import hashlib
+import logging
+import secrets
+import smtplib
+import threading
+import time
+from dataclasses import dataclass
+
+logger = logging.getLogger(__name__)
+
+# Idle connections kept per account; extras are closed on release
+MAX_CONNECTIONS = 2
+
+# Connections are closed after this many messages to stay under provider limits
+MAX_MESSAGES = 100
+
+# Servers drop idle SMTP sessions; older connections are closed without a ping
+MAX_IDLE_SECONDS = 100.0
+
+PoolKey = tuple[str, int, str, bytes]
+
+# Per-process salt, so pool keys never hold a reusable password digest
+_KEY_SALT = secrets.token_bytes(16)
+
+
+@dataclass(slots=True)
+class PooledConnection:
+    """An authenticated SMTP connection and its usage so far."""
+
+    server: smtplib.SMTP
+    sent: int = 0  # Messages sent over this connection
+    idle_since: float = 0.0  # time.monotonic() when it was last released
+
+
+_lock = threading.Lock()
+_idle: dict[PoolKey, list[PooledConnection]] = {}
+
+
+def make_key(host: str, port: int, account: str, password: str) -> PoolKey:
+    """
+    Build the pool key for an account without keeping its password.
+
+    The password is reduced to a salted digest, so a sender with different
+    credentials never borrows another sender's authenticated session.
+
+    Args:
+        host: SMTP server host
+        port: SMTP server port
+        account: Login name
+        password: Login password
+
+    Returns:
+        (host, port, account, password digest) identifying the account
+    """
+    digest = hashlib.blake2b(password.encode(), key=_KEY_SALT, digest_size=16)
+    return (host, port, account, digest.digest())
+
+
+def acquire(key: PoolKey) -> PooledConnection | None:
+    """
+    Take a live idle connection for an account out of the pool.
+
+    Connections idle for longer than MAX_IDLE_SECONDS are closed; the rest
+    are pinged with NOOP first and discarded if the server dropped them.
+
+    Args:
+        key: Account key from make_key()
+
+    Returns:
+        Pooled connection, or None if no live one is pooled
+    """
+    while True:
+        with _lock:
+            idle = _idle.get(key)
+            if not idle:
+                return None
+            pooled = idle.pop()
+
+        if time.monotonic() - pooled.idle_since > MAX_IDLE_SECONDS:
+            close(pooled.server)
+            continue
+
+        try:
+            code, _ = pooled.server.noop()
+            if code == 250:
+                return pooled
+        except (smtplib.SMTPException, OSError) as e:
+            logger.debug(f"Discarding dead pooled SMTP connection: {e}")
+        close(pooled.server)
+
+
+def release(key: PoolKey, pooled: PooledConnection) -> None:
+    """
+    Return a connection to the pool, closing it if it is used up or the pool is full.
+
+    Args:
+        key: Account key from make_key()
+        pooled: Connection to return, with its sent count already updated
+    """
+    if pooled.sent < MAX_MESSAGES:
+        pooled.idle_since = time.monotonic()
+        with _lock:
+            idle = _idle.setdefault(key, [])
+            if len(idle) < MAX_CONNECTIONS:
+                idle.append(pooled)
+                return
+
+    close(pooled.server)
+
+
+def drain() -> None:
+    """Close and forget every pooled connection."""
+    with _lock:
+        connections = [pooled for idle in _idle.values() for pooled in idle]
+        _idle.clear()
+
+    for pooled in connections:
+        close(pooled.server)
+
+
+def close(server: smtplib.SMTP) -> None:
+    """
+    Quit a connection, falling back to closing the socket if QUIT fails.
+
+    Args:
+        server: Connection to close
+    """
+    try:
+        server.quit()
+    except Exception as e:
+        logger.debug(f"Error during pooled SMTP quit: {e}")
+        server.close()
+
+
+atexit.register(drain)
@@ -4,20 +4,49 @@ Email sender implementation with retry mechanism for HTML emails.
 
 import logging
 import os
+import random
 import smtplib
 import ssl
 import time
+from dataclasses import dataclass
 from email.message import EmailMessage
 from typing import TYPE_CHECKING
 
+from . import _pool
 from .message_formatter import MessageFormatter
-from .models import EmailData, SendResult
+from .models import BatchResult, EmailData, SendResult
 
 if TYPE_CHECKING:
     from src.utils.config import EmailConfig
 
 logger = logging.getLogger(__name__)
 
+# Abort a batch once a third of it has failed (only for batches this large)
+BATCH_ABORT_MIN_SIZE = 30
+
+
+def _is_unrecoverable(error: BaseException) -> bool:
+    """
+    Check whether an SMTP failure will fail again on retry.
+
+    Only permanent (5xx) replies count; temporary 4xx refusals such as
+    greylisting (450/451) or a full mailbox (452) are worth retrying.
+
+    Args:
+        error: Exception raised by a send attempt (or its wrapped cause)
+
+    Returns:
+        True for bad credentials or sender/recipient addresses refused with 5xx
+    """
+    if isinstance(error, smtplib.SMTPRecipientsRefused):
+        codes = [code for code, _ in error.recipients.values()]
+        return bool(codes) and all(code >= 500 for code in codes)
+
+    if isinstance(error, (smtplib.SMTPAuthenticationError, smtplib.SMTPSenderRefused)):
+        return error.smtp_code >= 500
+
+    return False
+
 
 class EmailSenderError(Exception):
     """Base exception for email sender errors."""
@@ -25,6 +54,29 @@ class EmailSenderError(Exception):
     pass
 
 
+@dataclass(frozen=True)
+class RetryPolicy:
+    """Capped exponential backoff with full jitter for send retries."""
+
+    base: float = 0.1
+    cap: float = 5.0
+
+    def next_delay(self, attempt: int) -> float:
+        """
+        Get the delay before a retry.
+
+        The delay is drawn uniformly from zero up to the capped exponential
+        backoff, so senders retrying after the same outage spread out.
+
+        Args:
+            attempt: Zero-based retry number (0 for the first retry)
+
+        Returns:
+            Delay in seconds, between 0 and min(cap, base * 2**attempt)
+        """
+        return random.uniform(0, min(self.cap, self.base * 2**attempt))
+
+
 class EmailSender:
     """Handles email sending with retry mechanism for HTML emails."""
 
@@ -40,7 +92,10 @@ class EmailSender:
 
         # Rate limiting to avoid spam detection
         self.send_interval = int(os.getenv("EMAIL_SEND_INTERVAL", "2"))
-        self.last_send_time: float | None = None
+        self.last_send_time: float | None = None  # time.monotonic() of last send
+
+        # Retries wait on the same monotonic deadline as rate limiting
+        self.retry_policy = RetryPolicy()
 
         # Validate configuration
         self._validate_config()
@@ -64,8 +119,10 @@ class EmailSender:
             ):
                 return SendResult(
                     success=False,
-                    error_message="Missing required email data (recipient, subject, or content)",
                     retry_count=0,
+                    error=EmailSenderError(
+                        "Missing required email data (recipient, subject, or content)"
+                    ),
                 )
 
             # Send with retries (no security measures needed for HTML emails)
@@ -73,11 +130,61 @@ class EmailSender:
 
         except Exception as e:
             logger.error(f"Unexpected error in send_email: {e}")
-            return SendResult(
-                success=False,
-                error_message=f"Unexpected error: {str(e)}",
-                retry_count=0,
-            )
+            error = EmailSenderError(f"Unexpected error: {e}")
+            error.__cause__ = e
+            return SendResult(success=False, retry_count=0, error=error)
+
+    def send_batch(self, emails: list[EmailData]) -> BatchResult:
+        """
+        Send multiple emails, aborting early when too many fail.
+
+        Emails go out over one pooled SMTP session, so a batch pays for the
+        TLS handshake and login once rather than per recipient.
+
+        Once failures reach a third of a batch of at least BATCH_ABORT_MIN_SIZE
+        emails, the SMTP server or credentials are most likely broken, so the
+        remaining emails are skipped instead of being retried one by one.
+
+        Args:
+            emails: Email data to send, in order
+
+        Returns:
+            BatchResult with per-email results and aggregate counts
+        """
+        batch_size = len(emails)
+        results: list[SendResult] = []
+        failed_count = 0
+
+        for email_data in emails:
+            result = self.send_email(email_data)
+            results.append(result)
+
+            if result.success:
+                continue
+
+            failed_count += 1
+            if batch_size >= BATCH_ABORT_MIN_SIZE and failed_count * 3 >= batch_size:
+                skipped_count = batch_size - len(results)
+                logger.error(
+                    f"Aborting batch: {failed_count}/{batch_size} sends failed, "
+                    f"skipping remaining {skipped_count} emails"
+                )
+                return BatchResult(
+                    results=results,
+                    sent_count=len(results) - failed_count,
+                    failed_count=failed_count,
+                    skipped_count=skipped_count,
+                    aborted=True,
+                )
+
+        logger.info(
+            f"Batch complete: {batch_size - failed_count} sent, {failed_count} failed"
+        )
+        return BatchResult(
+            results=results,
+            sent_count=batch_size - failed_count,
+            failed_count=failed_count,
+        )
 
     def validate_connection(self) -> bool:
         """
@@ -113,31 +220,27 @@ class EmailSender:
         Returns:
             SendResult with success status and details
         """
-        last_error = None
+        # Kept as the exception; only the final result formats it
+        last_error: Exception | None = None
 
         for attempt in range(max_retries + 1):  # +1 for initial attempt
             try:
-                # Wait for rate limiting if needed
+                not_before = time.monotonic()
                 if attempt > 0:  # Don't wait on first attempt
-                    wait_time = min(2**attempt, 30)  # Exponential backoff, max 30s
+                    delay = self.retry_policy.next_delay(attempt - 1)
                     logger.info(
-                        f"Retry attempt {attempt}/{max_retries}, waiting {wait_time}s"
+                        f"Retry attempt {attempt}/{max_retries}, waiting {delay:.2f}s"
                     )
-                    time.sleep(wait_time)
+                    not_before += delay
 
                 # Apply rate limiting to avoid spam detection
-                if self.last_send_time and self.send_interval > 0:
-                    elapsed = time.time() - self.last_send_time
-                    if elapsed < self.send_interval:
-                        sleep_time = self.send_interval - elapsed
-                        logger.info(f"Rate limiting: waiting {sleep_time:.1f}s")
-                        time.sleep(sleep_time)
+                self._wait_until(not_before)
 
                 # Attempt to send
                 message_id = self._send_single_email(email_data)
 
                 # Record send time
-                self.last_send_time = time.time()
+                self.last_send_time = time.monotonic()
 
                 logger.info(
                     f"Email sent successfully to {email_data.recipient} (attempt {attempt + 1})"
@@ -147,13 +250,13 @@ class EmailSender:
                 )
 
             except Exception as e:
-                last_error = str(e)
+                last_error = e
                 logger.warning(f"Send attempt {attempt + 1} failed: {e}")
 
-                # Don't retry for certain errors
-                if "authentication" in str(e).lower() or "login" in str(e).lower():
-                    logger.error("Authentication error - not retrying")
-                    break
+                # Don't retry errors that will fail the same way again
+                if _is_unrecoverable(e.__cause__ or e):
+                    logger.error(f"Unrecoverable {type(e.__cause__ or e).__name__}")
+                    return SendResult(success=False, retry_count=attempt, error=e)
 
         # All attempts failed
         logger.error(
@@ -161,10 +264,29 @@ class EmailSender:
         )
         return SendResult(
             success=False,
-            error_message=last_error or "Unknown error during email sending",
             retry_count=max_retries + 1,
+            error=last_error or EmailSenderError("Unknown error during email sending"),
         )
 
+    def _wait_until(self, deadline: float) -> None:
+        """
+        Sleep until the later of a retry deadline and the rate-limit deadline.
+
+        Args:
+            deadline: Earliest time.monotonic() value at which to send
+        """
+        if self.last_send_time is not None and self.send_interval > 0:
+            rate_limit_deadline = self.last_send_time + self.send_interval
+            if rate_limit_deadline > deadline:
+                deadline = rate_limit_deadline
+                logger.info(
+                    f"Rate limiting: waiting {deadline - time.monotonic():.1f}s"
+                )
+
+        remaining = deadline - time.monotonic()
+        if remaining > 0:
+            time.sleep(remaining)
+
     def _send_single_email(self, email_data: EmailData) -> str:
         """
         Send a single email without retry logic.
@@ -200,27 +322,20 @@ class EmailSender:
                 )
                 msg.add_alternative(basic_html, subtype="html")
 
-            # Send the email using appropriate SMTP method
-            context = ssl.create_default_context()
+            # Reuse a pooled authenticated connection when one is available
+            pooled = _pool.acquire(self._pool_key)
+            if pooled is None:
+                pooled = _pool.PooledConnection(self._open_connection())
 
-            # Use sender credentials if available, otherwise use main credentials
-            email = self.config.sender_email or self.config.address
-            password = self.config.sender_password or self.config.password
+            try:
+                pooled.server.send_message(msg)
+            except BaseException:
+                # The SMTP session state is unknown after a failure
+                _pool.close(pooled.server)
+                raise
 
-            # Use SMTP_SSL for port 465, SMTP with starttls for port 587
-            if self.config.smtp_port == 465:
-                with smtplib.SMTP_SSL(
-                    self.config.smtp_server, self.config.smtp_port, context=context
-                ) as server:
-                    server.login(email, password)
-                    server.send_message(msg)
-            else:
-                with smtplib.SMTP(
-                    self.config.smtp_server, self.config.smtp_port
-                ) as server:
-                    server.starttls(context=context)
-                    server.login(email, password)
-                    server.send_message(msg)
+            pooled.sent += 1
+            _pool.release(self._pool_key, pooled)
 
             # Extract message ID
             message_id = msg.get("Message-ID", "unknown")
@@ -237,6 +352,50 @@ class EmailSender:
         except Exception as e:
             raise EmailSenderError(f"Unexpected error: {e}") from e
 
+    @property
+    def _pool_key(self) -> _pool.PoolKey:
+        """Account identity used to share pooled connections."""
+        return _pool.make_key(
+            self.config.smtp_server,
+            self.config.smtp_port,
+            self.config.sender_email or self.config.address,
+            self.config.sender_password or self.config.password,
+        )
+
+    def _open_connection(self) -> smtplib.SMTP:
+        """
+        Open and authenticate a new SMTP connection.
+
+        Returns:
+            Logged-in SMTP connection
+
+        Raises:
+            smtplib.SMTPException: If the handshake or login fails
+        """
+        context = ssl.create_default_context()
+
+        # Use sender credentials if available, otherwise use main credentials
+        email = self.config.sender_email or self.config.address
+        password = self.config.sender_password or self.config.password
+
+        # Use SMTP_SSL for port 465, SMTP with starttls for port 587
+        if self.config.smtp_port == 465:
+            server = smtplib.SMTP_SSL(
+                self.config.smtp_server, self.config.smtp_port, context=context
+            )
+        else:
+            server = smtplib.SMTP(self.config.smtp_server, self.config.smtp_port)
+
+        try:
+            if self.config.smtp_port != 465:
+                server.starttls(context=context)
+            server.login(email, password)
+        except BaseException:
+            server.close()
+            raise
+
+        return server
+
     def _validate_config(self) -> None:
         """Validate email configuration."""
         if not self.config.smtp_server:
@@ -12,6 +12,19 @@ logger = logging.getLogger(__name__)
 class MessageFormatter:
     """Formats email content into plain text messages."""
 
+    # Fixed header and footer segments, built once
+    _SEP = "=" * 50
+    _DATE_LABEL = "📅 日期："
+    _SOURCE_LABEL = "📰 來源："
+    _TIME_LABEL = "⏰ 生成時間："
+    _FOOTER_SIGNATURE = "📧 此郵件由 Good Morning Agent 自動生成"
+    _FOOTER_METADATA_LABEL = "📊 相關資訊："
+    _FOOTER_HELP = "如有問題，請檢查您的設定或聯繫管理員。"
+    _FOOTER_TIME_LABEL = "生成時間："
+
+    # Metadata keys the header already shows
+    _HEADER_KEYS = frozenset(("date", "source"))
+
     def __init__(self) -> None:
         """Initialize the message formatter."""
         pass
@@ -28,14 +41,21 @@ class MessageFormatter:
             Formatted plain text message
         """
         try:
-            # Start with headers
-            formatted_message = self._add_headers(content, metadata)
-
-            # Add main content
-            formatted_message += f"\n\n{content.strip()}\n"
+            # One clock reading for every timestamp in the message
+            now = datetime.now()
+
+            # Headers followed by the main content
+            formatted_message = "".join(
+                [
+                    self._add_headers(content, metadata, now),
+                    "\n\n",
+                    content.strip(),
+                    "\n",
+                ]
+            )
 
             # Add footers
-            formatted_message = self._add_footers(formatted_message, metadata)
+            formatted_message = self._add_footers(formatted_message, metadata, now)
 
             logger.debug(
                 f"Formatted message length: {len(formatted_message)} characters"
@@ -47,49 +67,51 @@ class MessageFormatter:
             # Return basic content if formatting fails
             return f"{content}\n\n---\nGenerated by Good Morning Agent"
 
-    def _add_headers(self, content: str, metadata: dict[str, Any]) -> str:
-        """Add header information to the message."""
-        headers = []
+    def _add_headers(
+        self, content: str, metadata: dict[str, Any], now: datetime | None = None
+    ) -> str:
+        """Add header information stamped with now (default: current time)."""
+        if now is None:
+            now = datetime.now()
 
         # Add date if available
-        if "date" in metadata:
-            headers.append(f"📅 日期：{metadata['date']}")
-        else:
-            headers.append(f"📅 日期：{datetime.now().strftime('%Y-%m-%d')}")
+        date = metadata["date"] if "date" in metadata else now.strftime("%Y-%m-%d")
+        headers = [self._DATE_LABEL + str(date)]
 
         # Add source if available
         if "source" in metadata:
-            headers.append(f"📰 來源：{metadata['source']}")
+            headers.append(self._SOURCE_LABEL + str(metadata["source"]))
 
-        # Add generation time
-        headers.append(f"⏰ 生成時間：{datetime.now().strftime('%H:%M:%S')}")
-
-        # Add separator
-        headers.append("=" * 50)
+        # Add generation time and separator
+        headers.append(self._TIME_LABEL + now.strftime("%H:%M:%S"))
+        headers.append(self._SEP)
 
         return "\n".join(headers)
 
-    def _add_footers(self, content: str, metadata: dict[str, Any]) -> str:
-        """Add footer information to the message."""
-        footers = [
-            "",
-            "=" * 50,
-            "📧 此郵件由 Good Morning Agent 自動生成",
-        ]
+    def _add_footers(
+        self, content: str, metadata: dict[str, Any], now: datetime | None = None
+    ) -> str:
+        """Add footer information stamped with now (default: current time)."""
+        if now is None:
+            now = datetime.now()
+
+        footers = [content, "", self._SEP, self._FOOTER_SIGNATURE]
 
         # Add metadata information if present
         if metadata:
-            footers.append("📊 相關資訊：")
-            for key, value in metadata.items():
-                if key not in ["date", "source"]:  # Skip already shown metadata
-                    footers.append(f"   • {key}: {value}")
+            footers.append(self._FOOTER_METADATA_LABEL)
+            footers.extend(
+                f"   • {key}: {value}"
+                for key, value in metadata.items()
+                if key not in self._HEADER_KEYS  # Skip already shown metadata
+            )
 
         footers.extend(
             [
                 "",
-                "如有問題，請檢查您的設定或聯繫管理員。",
-                f"生成時間：{datetime.now().isoformat()}",
+                self._FOOTER_HELP,
+                self._FOOTER_TIME_LABEL + now.isoformat(),
             ]
         )
 
-        return content + "\n" + "\n".join(footers)
+        return "\n".join(footers)
@@ -2,18 +2,19 @@
 Data models for email sending functionality.
 """
 
+from collections.abc import Mapping
 from dataclasses import dataclass
 from typing import Any
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class EmailData:
-    """Data structure for email content and metadata."""
+    """Data structure for email content and metadata (immutable once validated)."""
 
     recipient: str
     subject: str
     content: str
-    metadata: dict[str, Any]
+    metadata: Mapping[str, Any]  # May be a read-only MappingProxyType view
     html_content: str | None = None  # Optional HTML version of content
 
     def __post_init__(self) -> None:
@@ -28,18 +29,40 @@ class EmailData:
             raise ValueError("Recipient must be a valid email address")
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SendResult:
     """Result of email sending operation."""
 
     success: bool
     message_id: str | None = None
-    error_message: str | None = None
     retry_count: int = 0
+    error: BaseException | None = None  # Exception behind a failed send, if any
 
     def __post_init__(self) -> None:
-        """Validate send result after initialization."""
+        """Validate send result and drop tracebacks it would otherwise keep alive."""
         if self.success and not self.message_id:
             raise ValueError("Successful send must have a message_id")
-        if not self.success and not self.error_message:
-            raise ValueError("Failed send must have an error_message")
+        if not self.success and self.error is None:
+            raise ValueError("Failed send must have an error")
+
+        # Results outlive the send; keep the exceptions but not their frames
+        error = self.error
+        while error is not None and error.__traceback__ is not None:
+            error.__traceback__ = None
+            error = error.__cause__ or error.__context__
+
+    @property
+    def error_message(self) -> str | None:
+        """Message of the exception behind a failed send, formatted on demand."""
+        return None if self.error is None else str(self.error)
+
+
+@dataclass
+class BatchResult:
+    """Result of a batch email sending operation."""
+
+    results: list[SendResult]
+    sent_count: int = 0
+    failed_count: int = 0
+    skipped_count: int = 0  # Emails never attempted because the batch aborted
+    aborted: bool = False
@@ -18,6 +18,10 @@ from unittest.mock import Mock, patch
 import pytest
 from dotenv import load_dotenv
 
+from src.collectors import _pool
+from src.senders import _pool as smtp_pool
+from tests.support.fake_smtp import FakeSMTP
+
 
 # Test Environment Setup
 @pytest.fixture(scope="session", autouse=True)
@@ -62,6 +66,13 @@ def mock_email_credentials() -> dict[str, str]:
     }
 
 
+@pytest.fixture(scope="session", autouse=True)
+def drain_imap_pool() -> Generator[None, None, None]:
+    """Log out pooled IMAP connections once the session is over."""
+    yield
+    _pool.drain()
+
+
 @pytest.fixture
 def mock_imap_connection():
     """Mock IMAP connection for email testing."""
@@ -184,6 +195,17 @@ def mock_smtp_connection():
         yield mock_connection
 
 
+@pytest.fixture
+def fake_smtp(monkeypatch) -> Generator[FakeSMTP, None, None]:
+    """Replace smtplib.SMTP with an in-process FakeSMTP server."""
+    # Pooled connections from earlier tests would bypass this fake
+    smtp_pool.drain()
+    server = FakeSMTP()
+    monkeypatch.setattr("src.senders.email_sender.smtplib.SMTP", server)
+    yield server
+    smtp_pool.drain()
+
+
 # Configuration Testing Fixtures
 @pytest.fixture
 def test_config() -> dict[str, Any]:
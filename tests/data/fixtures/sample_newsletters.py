@@ -5,6 +5,7 @@ This module contains realistic newsletter samples for testing the email
 processing pipeline.
 """
 
+from collections.abc import Sequence
 from typing import Any
 
 # TLDR Newsletter Sample
@@ -178,12 +179,13 @@ PRAGMATIC_ENGINEER = {
 }
 
 
-# Collection of all sample newsletters
-ALL_SAMPLE_NEWSLETTERS: list[dict[str, Any]] = [
-    TLDR_NEWSLETTER,
-    DEEP_LEARNING_WEEKLY,
-    PRAGMATIC_ENGINEER,
-]
+def all_sample_newsletters() -> Sequence[dict[str, Any]]:
+    """Get all sample newsletters as a read-only sequence."""
+    return (
+        TLDR_NEWSLETTER,
+        DEEP_LEARNING_WEEKLY,
+        PRAGMATIC_ENGINEER,
+    )
 
 
 # Expected AI summaries for testing
@@ -7,6 +7,7 @@ Email Collection → Content Processing → AI Summarization → Email Delivery
 These tests require real external services and should be run less frequently.
 """
 
+import functools
 import os
 from datetime import datetime, timedelta
 from pathlib import Path
@@ -15,6 +16,19 @@ from typing import Any
 import pytest
 
 
+@functools.cache
+def _env(key: str) -> str | None:
+    """Read an environment variable once per test."""
+    return os.getenv(key)
+
+
+@pytest.fixture(autouse=True)
+def clear_env_cache():
+    """Clear cached environment reads so monkeypatch.setenv takes effect."""
+    yield
+    _env.cache_clear()
+
+
 class TestFullPipeline:
     """End-to-end pipeline tests."""
 
@@ -81,18 +95,18 @@ def setup_test_environment() -> dict[str, Any]:
     """Setup complete test environment for E2E tests."""
     return {
         "email_credentials": {
-            "collection_email": os.getenv("INTEGRATION_COLLECTION_EMAIL"),
-            "collection_password": os.getenv("INTEGRATION_EMAIL_PASSWORD"),
-            "sender_email": os.getenv("INTEGRATION_SENDER_EMAIL"),
-            "sender_password": os.getenv("INTEGRATION_SENDER_PASSWORD"),
+            "collection_email": _env("INTEGRATION_COLLECTION_EMAIL"),
+            "collection_password": _env("INTEGRATION_EMAIL_PASSWORD"),
+            "sender_email": _env("INTEGRATION_SENDER_EMAIL"),
+            "sender_password": _env("INTEGRATION_SENDER_PASSWORD"),
         },
         "api_keys": {
-            "openai_api_key": os.getenv("INTEGRATION_OPENAI_API_KEY"),
+            "openai_api_key": _env("INTEGRATION_OPENAI_API_KEY"),
         },
         "test_config": {
             "max_processing_time": 300,  # 5 minutes
             "expected_newsletter_count": 3,
-            "test_recipient": os.getenv("TEST_RECIPIENT_EMAIL"),
+            "test_recipient": _env("TEST_RECIPIENT_EMAIL"),
         },
     }
 
@@ -1,8 +1,8 @@
 """
 Integration tests for email sending functionality.
 
-These tests use mocked SMTP servers to test the full email sending pipeline
-without actually sending emails.
+These tests use an in-process fake SMTP server to test the full email sending
+pipeline without actually sending emails.
 """
 
 import logging
@@ -13,6 +13,10 @@ import pytest
 from src.senders import EmailData, EmailSender, SendResult
 from src.utils.config import EmailConfig
 
+# Tests here patch process-wide state (smtplib.SMTP, EMAIL_SEND_INTERVAL), so
+# keep them on one worker when running under pytest-xdist --dist loadgroup
+pytestmark = pytest.mark.xdist_group("smtp_integration")
+
 
 @pytest.fixture
 def mock_email_config():
@@ -27,9 +31,9 @@ def mock_email_config():
     return config
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_email_data():
-    """Create sample email data for testing."""
+    """Create sample email data for testing (read-only, shared by all tests)."""
     return EmailData(
         recipient="recipient@example.com",
         subject="Integration Test Email",
@@ -52,15 +56,10 @@ def sample_email_data():
 class TestEmailSendingIntegration:
     """Integration tests for the complete email sending pipeline."""
 
-    @patch("src.senders.email_sender.smtplib.SMTP")
     def test_full_email_sending_pipeline(
-        self, mock_smtp, mock_email_config, sample_email_data
+        self, fake_smtp, mock_email_config, sample_email_data
     ):
-        """Test the complete email sending pipeline with mocked SMTP."""
-        # Setup mock SMTP server
-        mock_server = Mock()
-        mock_smtp.return_value.__enter__.return_value = mock_server
-
+        """Test the complete email sending pipeline with a fake SMTP server."""
         # Create email sender
         sender = EmailSender(mock_email_config)
 
@@ -74,45 +73,30 @@ class TestEmailSendingIntegration:
         assert result.error_message is None
 
         # Verify SMTP interactions
-        mock_server.starttls.assert_called_once()
-        mock_server.login.assert_called_once_with(
-            "test-sender@example.com", "test-sender-password"
-        )
-        mock_server.send_message.assert_called_once()
+        assert fake_smtp.starttls_count == 1
+        assert fake_smtp.logins == [("test-sender@example.com", "test-sender-password")]
+        assert len(fake_smtp.sent) == 1
 
         # Verify message content was processed
-        call_args = mock_server.send_message.call_args[0][0]
-        assert call_args["To"] == "recipient@example.com"
-        assert call_args["Subject"].startswith(
+        sent_message = fake_smtp.sent[0]
+        assert sent_message["To"] == "recipient@example.com"
+        assert sent_message["Subject"].startswith(
             "Integration Test Email"
         )  # May have anti-spam suffix
-        assert call_args["From"] == "test-sender@example.com"
+        assert sent_message["From"] == "test-sender@example.com"
 
-    @patch("src.senders.email_sender.smtplib.SMTP")
     def test_email_formatting_integration(
-        self, mock_smtp, mock_email_config, sample_email_data
+        self, fake_smtp, mock_email_config, sample_email_data
     ):
         """Test that email formatting works correctly in integration."""
-        mock_server = Mock()
-        mock_smtp.return_value.__enter__.return_value = mock_server
-
-        # Capture the formatted message
-        captured_message = None
-
-        def capture_message(msg):
-            nonlocal captured_message
-            captured_message = msg
-
-        mock_server.send_message.side_effect = capture_message
-
         sender = EmailSender(mock_email_config)
         result = sender.send_email(sample_email_data)
 
         assert result.success is True
-        assert captured_message is not None
+        assert len(fake_smtp.sent) == 1
 
         # Extract the text payload and decode if needed
-        text_part = captured_message.get_payload()[0]
+        text_part = fake_smtp.sent[0].get_payload()[0]
         formatted_message = text_part.get_payload(decode=True).decode("utf-8")
 
         # Verify formatted content contains expected elements
@@ -122,36 +106,28 @@ class TestEmailSendingIntegration:
         assert "Good Morning Agent" in formatted_message
         assert "test_id: test_001" in formatted_message
 
-    @patch("src.senders.email_sender.smtplib.SMTP")
     def test_security_measures_integration(
-        self, mock_smtp, mock_email_config, sample_email_data
+        self, fake_smtp, mock_email_config, sample_email_data
     ):
         """Test that security measures are applied in integration."""
-        mock_server = Mock()
-        mock_smtp.return_value.__enter__.return_value = mock_server
-
         sender = EmailSender(mock_email_config)
         result = sender.send_email(sample_email_data)
 
         assert result.success is True
 
         # Verify security headers were added
-        call_args = mock_server.send_message.call_args[0][0]
-        assert call_args["X-Mailer"] is not None
-        assert "Good Morning Agent" in call_args["X-Mailer"]
-        assert call_args["Message-ID"] is not None
-        assert call_args["X-Priority"] == "3 (Normal)"
+        sent_message = fake_smtp.sent[0]
+        assert sent_message["X-Mailer"] is not None
+        assert "Good Morning Agent" in sent_message["X-Mailer"]
+        assert sent_message["Message-ID"] is not None
+        assert sent_message["X-Priority"] == "3 (Normal)"
 
     @patch.dict("os.environ", {"EMAIL_SEND_INTERVAL": "1"})
-    @patch("src.senders.email_sender.smtplib.SMTP")
     @patch("time.sleep")
     def test_rate_limiting_integration(
-        self, mock_sleep, mock_smtp, mock_email_config, sample_email_data
+        self, mock_sleep, fake_smtp, mock_email_config, sample_email_data
     ):
         """Test rate limiting works in integration."""
-        mock_server = Mock()
-        mock_smtp.return_value.__enter__.return_value = mock_server
-
         sender = EmailSender(mock_email_config)
 
         # Send first email
@@ -165,54 +141,56 @@ class TestEmailSendingIntegration:
         # Should have called sleep for rate limiting
         mock_sleep.assert_called()
 
-    @patch("src.senders.email_sender.smtplib.SMTP")
+        # Both emails went over one pooled, authenticated connection
+        assert fake_smtp.connections == 1
+        assert len(fake_smtp.logins) == 1
+
     def test_retry_mechanism_integration(
-        self, mock_smtp, mock_email_config, sample_email_data
+        self, fake_smtp, mock_email_config, sample_email_data
     ):
         """Test retry mechanism works in integration."""
-        mock_server = Mock()
-        mock_smtp.return_value.__enter__.return_value = mock_server
-
         # Fail first two attempts, succeed on third
-        mock_server.send_message.side_effect = [
-            Exception("Temporary error 1"),
-            Exception("Temporary error 2"),
-            None,  # Success
-        ]
+        fake_smtp.send_errors.extend(
+            [Exception("Temporary error 1"), Exception("Temporary error 2")]
+        )
 
         sender = EmailSender(mock_email_config)
 
-        with patch("time.sleep"):  # Speed up test
+        with (
+            patch(
+                "src.senders.email_sender.random.uniform",
+                side_effect=lambda low, high: high,
+            ),
+            patch("time.sleep") as mock_sleep,
+        ):
             result = sender.send_email(sample_email_data)
 
         assert result.success is True
         assert result.retry_count == 2
-        assert mock_server.send_message.call_count == 3
+        assert fake_smtp.connections == 3
+        assert len(fake_smtp.sent) == 1
 
-    @patch("src.senders.email_sender.smtplib.SMTP")
-    def test_connection_validation_integration(self, mock_smtp, mock_email_config):
-        """Test connection validation in integration."""
-        mock_server = Mock()
-        mock_smtp.return_value.__enter__.return_value = mock_server
+        # Exponential backoff from the retry policy, at the top of the jitter range
+        delays = [call.args[0] for call in mock_sleep.call_args_list]
+        assert delays == pytest.approx([0.1, 0.2], abs=0.01)
 
+    def test_connection_validation_integration(self, fake_smtp, mock_email_config):
+        """Test connection validation in integration."""
         sender = EmailSender(mock_email_config)
 
         # Test successful validation
         result = sender.validate_connection()
         assert result is True
 
-        mock_server.starttls.assert_called()
-        mock_server.login.assert_called_with(
-            "test-sender@example.com", "test-sender-password"
-        )
+        assert fake_smtp.starttls_count == 1
+        assert fake_smtp.logins == [("test-sender@example.com", "test-sender-password")]
 
-    @patch("src.senders.email_sender.smtplib.SMTP")
     def test_error_handling_integration(
-        self, mock_smtp, mock_email_config, sample_email_data
+        self, fake_smtp, mock_email_config, sample_email_data
     ):
         """Test error handling in integration."""
         # Test SMTP connection failure
-        mock_smtp.side_effect = Exception("Connection failed")
+        fake_smtp.connect_error = Exception("Connection failed")
 
         sender = EmailSender(mock_email_config)
         result = sender.send_email(sample_email_data)
@@ -221,6 +199,36 @@ class TestEmailSendingIntegration:
         assert "Connection failed" in result.error_message
         assert result.retry_count > 0  # Should have attempted retries
 
+    def test_send_batch_aborts_on_one_third_failures(
+        self, fake_smtp, mock_email_config
+    ):
+        """Test batch sending stops once a third of the batch has failed."""
+        failing = {f"user{i}@example.com" for i in range(10)}
+        fake_smtp.refused_recipients = failing
+
+        emails = [
+            EmailData(
+                recipient=f"user{i}@example.com",
+                subject=f"Test Email {i}",
+                content=f"Content for email {i}",
+                metadata={},
+            )
+            for i in range(30)
+        ]
+
+        sender = EmailSender(mock_email_config)
+        with patch("time.sleep"):
+            result = sender.send_batch(emails)
+
+        assert result.aborted is True
+        assert result.failed_count == 10
+        assert result.sent_count == 0
+        assert result.skipped_count == 20
+
+        # Only the failing recipients were ever attempted
+        assert len(fake_smtp.sent) == 0
+        assert fake_smtp.connections == 10  # refused recipients are not retried
+
     def test_config_validation_integration(self, mock_email_config):
         """Test configuration validation in integration."""
         # Test with invalid config
@@ -231,12 +239,8 @@ class TestEmailSendingIntegration:
         with pytest.raises(EmailSenderError):
             EmailSender(mock_email_config)
 
-    @patch("src.senders.email_sender.smtplib.SMTP")
-    def test_multiple_emails_integration(self, mock_smtp, mock_email_config):
+    def test_multiple_emails_integration(self, fake_smtp, mock_email_config):
         """Test sending multiple emails in sequence."""
-        mock_server = Mock()
-        mock_smtp.return_value.__enter__.return_value = mock_server
-
         sender = EmailSender(mock_email_config)
 
         # Send multiple emails
@@ -262,14 +266,10 @@ class TestEmailSendingIntegration:
             assert result.message_id is not None
 
         # Should have sent all emails
-        assert mock_server.send_message.call_count == 3
+        assert len(fake_smtp.sent) == 3
 
-    @patch("src.senders.email_sender.smtplib.SMTP")
-    def test_unicode_content_integration(self, mock_smtp, mock_email_config):
+    def test_unicode_content_integration(self, fake_smtp, mock_email_config):
         """Test handling of Unicode content in integration."""
-        mock_server = Mock()
-        mock_smtp.return_value.__enter__.return_value = mock_server
-
         # Email with various Unicode characters
         unicode_email = EmailData(
             recipient="test@example.com",
@@ -293,8 +293,7 @@ class TestEmailSendingIntegration:
         assert result.success is True
 
         # Verify the message was sent
-        mock_server.send_message.assert_called_once()
+        assert len(fake_smtp.sent) == 1
 
         # Verify subject contains Unicode
-        call_args = mock_server.send_message.call_args[0][0]
-        assert "測試" in call_args["Subject"]
+        assert "測試" in fake_smtp.sent[0]["Subject"]
@@ -237,7 +237,7 @@ class TestProcessorsIntegration:
         result = self.processor.process_newsletters([])
         assert result.success is False
         assert result.processed_count == 0
-        assert "No newsletters to process" in str(result.errors)
+        assert result.has_error("No newsletters to process")
 
         # Test newsletter with minimal content
         minimal_newsletter = NewsletterContent(
@@ -12,143 +12,214 @@ Usage:
     python tests/run_tests.py --unit
     python tests/run_tests.py --integration
     python tests/run_tests.py --e2e
+    python tests/run_tests.py --unit --integration  # one pytest session
     python tests/run_tests.py --all
     python tests/run_tests.py --coverage
+    python tests/run_tests.py --lint [--sequential]
 """
 
 import argparse
+import functools
+import importlib.util
 import os
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any
 
 
 def run_command(cmd: list[str], description: str) -> bool:
-    """Run a command and return success status."""
+    """Run a command, streaming its output as it runs, and return success."""
     print(f"\n🔄 {description}")
-    print(f"Running: {' '.join(cmd)}")
-
-    try:
-        result = subprocess.run(cmd, check=True, capture_output=True, text=True)
-        print(f"✅ {description} completed successfully")
-        if result.stdout:
-            print(result.stdout)
-        return True
-    except subprocess.CalledProcessError as e:
+    print(f"Running: {' '.join(cmd)}", flush=True)
+
+    with subprocess.Popen(
+        cmd,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        text=True,
+        bufsize=1,
+    ) as proc:
+        assert proc.stdout is not None
+        for line in proc.stdout:
+            sys.stdout.write(line)
+            sys.stdout.flush()
+        returncode = proc.wait()
+
+    if returncode != 0:
         print(f"❌ {description} failed")
-        print(f"Exit code: {e.returncode}")
-        if e.stdout:
-            print("STDOUT:", e.stdout)
-        if e.stderr:
-            print("STDERR:", e.stderr)
+        print(f"Exit code: {returncode}")
         return False
 
+    print(f"✅ {description} completed successfully")
+    return True
 
+
+def run_command_captured(cmd: list[str], description: str) -> tuple[bool, str]:
+    """Run a command quietly and return success status plus its report."""
+    result = subprocess.run(
+        cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True
+    )
+
+    lines = [f"\n🔄 {description}", f"Running: {' '.join(cmd)}"]
+    if result.stdout:
+        lines.append(result.stdout.rstrip("\n"))
+    if result.returncode == 0:
+        lines.append(f"✅ {description} completed successfully")
+    else:
+        lines.append(f"❌ {description} failed")
+        lines.append(f"Exit code: {result.returncode}")
+
+    return result.returncode == 0, "\n".join(lines)
+
+
+@functools.cache
 def check_test_requirements() -> bool:
-    """Check if test requirements are installed."""
-    try:
-        import importlib.util
-
-        # Check if required packages are available
-        required_packages = ["pytest", "pytest_cov", "pytest_mock"]
-        for package in required_packages:
-            if importlib.util.find_spec(package) is None:
-                raise ImportError(f"Package {package} not found")
-
-        return True
-    except ImportError as e:
-        print(f"❌ Missing test dependencies: {e}")
+    """Check if test requirements are installed (without importing them)."""
+    required_packages = ["pytest", "pytest_cov", "pytest_mock"]
+    missing = [
+        package
+        for package in required_packages
+        if importlib.util.find_spec(package) is None
+    ]
+
+    if missing:
+        print(f"❌ Missing test dependencies: {', '.join(missing)}")
         print("Run: uv sync --dev")
         return False
 
+    return True
+
+
+# Marker filter of each suite: (path, required marker, excluded marker)
+SUITES = {
+    "unit": ("tests/unit/", None, "slow"),
+    "integration": ("tests/integration/", "integration", None),
+    "e2e": ("tests/e2e/", "e2e", None),
+}
+
+# Quiet console output by default; TEST_VERBOSE=1 restores per-test lines
+VERBOSE = os.getenv("TEST_VERBOSE") == "1"
+OUTPUT_ARGS = ["-v"] if VERBOSE else ["-q", "--no-header"]
+
+# CI runs never use --lf/--ff, so skip reading and writing .pytest_cache there
+CI = bool(os.getenv("CI"))
+CACHE_ARGS = ["-p", "no:cacheprovider"] if CI else []
+
+INTEGRATION_VARS = [
+    "INTEGRATION_COLLECTION_EMAIL",
+    "INTEGRATION_EMAIL_PASSWORD",
+]
+
+E2E_VARS = INTEGRATION_VARS + [
+    "INTEGRATION_OPENAI_API_KEY",
+    "INTEGRATION_SENDER_EMAIL",
+    "INTEGRATION_SENDER_PASSWORD",
+]
+
+# Console label of each suite and the credentials it needs to run
+SUITE_LABELS = {
+    "unit": "Unit tests",
+    "integration": "Integration tests",
+    "e2e": "End-to-end tests",
+}
+SUITE_VARS = {
+    "integration": (INTEGRATION_VARS, "Integration tests"),
+    "e2e": (E2E_VARS, "E2E tests"),
+}
+
+
+class SuiteSelection:
+    """pytest plugin applying each suite's own marker filter in one session."""
+
+    def __init__(self, suites: list[str]):
+        self.rules = [
+            (Path(path).resolve(), required, excluded)
+            for path, required, excluded in (SUITES[name] for name in suites)
+        ]
+
+    def _selected(self, item: Any) -> bool:
+        for path, required, excluded in self.rules:
+            if not Path(item.path).is_relative_to(path):
+                continue
+            if required and item.get_closest_marker(required) is None:
+                continue
+            if excluded and item.get_closest_marker(excluded) is not None:
+                continue
+            return True
+        return False
 
-def run_unit_tests() -> bool:
-    """Run unit tests only."""
-    cmd = [
-        "python",
-        "-m",
-        "pytest",
-        "tests/unit/",
-        "-v",
-        "--tb=short",
-        "-m",
-        "not slow",
-    ]
-    return run_command(cmd, "Unit tests")
+    def pytest_collection_modifyitems(self, config: Any, items: list[Any]) -> None:
+        selected, deselected = [], []
+        for item in items:
+            (selected if self._selected(item) else deselected).append(item)
 
+        if deselected:
+            config.hook.pytest_deselected(items=deselected)
+            items[:] = selected
 
-def run_integration_tests() -> bool:
-    """Run integration tests."""
-    # Check for integration test requirements
-    required_vars = [
-        "INTEGRATION_COLLECTION_EMAIL",
-        "INTEGRATION_EMAIL_PASSWORD",
-    ]
 
-    missing_vars = [var for var in required_vars if not os.getenv(var)]
-    if missing_vars:
-        print("⚠️  Integration tests skipped - missing environment variables:")
-        for var in missing_vars:
-            print(f"   - {var}")
-        print("Set these variables to run integration tests")
-        return True  # Don't fail if integration tests are skipped
+def run_pytest(suites: list[str], description: str) -> bool:
+    """Run the given suites in one in-process pytest session."""
+    import pytest
 
-    cmd = [
-        "python",
-        "-m",
-        "pytest",
-        "tests/integration/",
-        "-v",
-        "--tb=short",
-        "-m",
-        "integration",
-    ]
-    return run_command(cmd, "Integration tests")
-
-
-def run_e2e_tests() -> bool:
-    """Run end-to-end tests."""
-    # Check for E2E test requirements
-    required_vars = [
-        "INTEGRATION_COLLECTION_EMAIL",
-        "INTEGRATION_EMAIL_PASSWORD",
-        "INTEGRATION_OPENAI_API_KEY",
-        "INTEGRATION_SENDER_EMAIL",
-        "INTEGRATION_SENDER_PASSWORD",
-    ]
+    args = [SUITES[name][0] for name in suites] + OUTPUT_ARGS + CACHE_ARGS
+    args.append("--tb=short")
+    if "e2e" in suites:
+        args.append("-s")  # Don't capture output for E2E tests
 
+    print(f"\n🔄 {description}")
+    print(f"Running: pytest {' '.join(args)}", flush=True)
+
+    exit_code = pytest.main(args, plugins=[SuiteSelection(suites)])
+    if exit_code != 0:
+        print(f"❌ {description} failed")
+        print(f"Exit code: {int(exit_code)}")
+        return False
+
+    print(f"✅ {description} completed successfully")
+    return True
+
+
+def has_required_env(required_vars: list[str], suite_name: str) -> bool:
+    """Check environment variables a suite needs, reporting missing ones."""
     missing_vars = [var for var in required_vars if not os.getenv(var)]
     if missing_vars:
-        print("⚠️  E2E tests skipped - missing environment variables:")
+        print(f"⚠️  {suite_name} skipped - missing environment variables:")
         for var in missing_vars:
             print(f"   - {var}")
-        print("Set these variables to run E2E tests")
-        return True  # Don't fail if E2E tests are skipped
+        print(f"Set these variables to run {suite_name}")
+        return False
 
-    cmd = [
-        "python",
-        "-m",
-        "pytest",
-        "tests/e2e/",
-        "-v",
-        "--tb=short",
-        "-m",
-        "e2e",
-        "-s",  # Don't capture output for E2E tests
+    return True
+
+
+def run_test_suites(requested: list[str], description: str | None = None) -> bool:
+    """
+    Run the requested suites together in a single pytest session.
+
+    pytest.main() reuses imported modules and their state when called again
+    in the same interpreter, so every selected suite goes into one call.
+    Suites missing their credentials are skipped rather than failed.
+    """
+    suites = [
+        name
+        for name in requested
+        if name not in SUITE_VARS or has_required_env(*SUITE_VARS[name])
     ]
-    return run_command(cmd, "End-to-end tests")
+    if not suites:
+        return True  # Don't fail if every requested suite is skipped
 
+    if description is None:
+        description = " + ".join(SUITE_LABELS[name] for name in suites)
 
-def run_all_tests() -> bool:
-    """Run all test suites."""
-    success = True
-    success &= run_unit_tests()
-    success &= run_integration_tests()
-    success &= run_e2e_tests()
-    return success
+    return run_pytest(suites, description)
 
 
 def run_tests_with_coverage() -> bool:
     """Run tests with coverage reporting."""
+    # Coverage gets a fresh interpreter so every src import is traced
     cmd = [
         "python",
         "-m",
@@ -156,9 +227,11 @@ def run_tests_with_coverage() -> bool:
         "tests/",
         "--cov=src",
         "--cov-report=html:htmlcov",
-        "--cov-report=term-missing",
+        # Missing-line listings are only worth printing for local runs
+        "--cov-report=term" if CI else "--cov-report=term-missing",
         "--cov-fail-under=80",
-        "-v",
+        *OUTPUT_ARGS,
+        *CACHE_ARGS,
     ]
 
     success = run_command(cmd, "Tests with coverage")
@@ -169,8 +242,8 @@ def run_tests_with_coverage() -> bool:
     return success
 
 
-def run_linting() -> bool:
-    """Run code quality checks."""
+def run_linting(sequential: bool = False) -> bool:
+    """Run code quality checks, concurrently unless sequential is set."""
     checks = [
         (
             ["python", "-m", "black", "--check", "src/", "tests/"],
@@ -183,11 +256,20 @@ def run_linting() -> bool:
         (["python", "-m", "mypy", "src/"], "MyPy type checking"),
     ]
 
-    success = True
-    for cmd, description in checks:
-        success &= run_command(cmd, description)
+    if sequential:
+        success = True
+        for cmd, description in checks:
+            success &= run_command(cmd, description)
+        return success
 
-    return success
+    # Each tool is its own process; report in the original order
+    with ThreadPoolExecutor(max_workers=len(checks)) as executor:
+        results = list(executor.map(lambda check: run_command_captured(*check), checks))
+
+    for _, report in results:
+        print(report)
+
+    return all(passed for passed, _ in results)
 
 
 def main():
@@ -203,6 +285,11 @@ def main():
         "--coverage", action="store_true", help="Run tests with coverage"
     )
     parser.add_argument("--lint", action="store_true", help="Run linting checks")
+    parser.add_argument(
+        "--sequential",
+        action="store_true",
+        help="Run linting checks one at a time (for debugging)",
+    )
 
     args = parser.parse_args()
 
@@ -215,25 +302,20 @@ def main():
 
     success = True
 
-    if args.unit or (
-        not any([args.integration, args.e2e, args.all, args.coverage, args.lint])
-    ):
-        success &= run_unit_tests()
-
-    if args.integration:
-        success &= run_integration_tests()
-
-    if args.e2e:
-        success &= run_e2e_tests()
-
     if args.all:
-        success &= run_all_tests()
+        success &= run_test_suites(list(SUITES), "All test suites")
+    else:
+        requested = [name for name in SUITES if getattr(args, name)]
+        if not requested and not (args.coverage or args.lint):
+            requested = ["unit"]
+        if requested:
+            success &= run_test_suites(requested)
 
     if args.coverage:
         success &= run_tests_with_coverage()
 
     if args.lint:
-        success &= run_linting()
+        success &= run_linting(sequential=args.sequential)
 
     print("\n" + "=" * 50)
     if success:
@@ -0,0 +1 @@
+"""Shared test doubles for Good Morning Agent tests."""
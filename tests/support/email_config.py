@@ -0,0 +1,15 @@
+"""
+Email configuration stand-in for sender tests.
+"""
+
+
+class MockEmailConfig:
+    """Mock email configuration for testing."""
+
+    def __init__(self):
+        self.smtp_server = "smtp.gmail.com"
+        self.smtp_port = 587
+        self.sender_email = "sender@example.com"
+        self.sender_password = "sender_password"
+        self.address = "main@example.com"
+        self.password = "main_password"
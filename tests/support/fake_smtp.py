@@ -0,0 +1,86 @@
+"""
+In-process fake SMTP server for email sending tests.
+
+A FakeSMTP instance replaces the ``smtplib.SMTP`` class: calling it returns
+the instance itself, which then records everything sent through it. This
+avoids the per-call bookkeeping overhead of ``unittest.mock``.
+"""
+
+import smtplib
+from collections import deque
+from email.message import EmailMessage
+from typing import Any
+
+
+class FakeSMTP:
+    """Minimal stand-in for ``smtplib.SMTP`` that records sent messages."""
+
+    def __init__(self) -> None:
+        """Initialize an empty fake server."""
+        self.sent: deque[EmailMessage] = deque()
+        self.logins: list[tuple[str, str]] = []
+        self.connections = 0
+        self.starttls_count = 0
+        self.quit_count = 0
+        self.close_count = 0
+        self.esmtp_features: dict[str, str] = {}
+
+        # Failure injection
+        self.connect_error: Exception | None = None
+        self.login_error: Exception | None = None
+        self.send_errors: deque[Exception | None] = deque()
+        self.refused_recipients: set[str] = set()
+
+    def __call__(self, host: str = "", port: int = 0, **kwargs: Any) -> "FakeSMTP":
+        """Open a connection, as ``smtplib.SMTP(host, port)`` would."""
+        if self.connect_error is not None:
+            raise self.connect_error
+        self.connections += 1
+        return self
+
+    def __enter__(self) -> "FakeSMTP":
+        """Context manager entry."""
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        """Context manager exit; the fake holds no resources."""
+        return None
+
+    def starttls(self, **kwargs: Any) -> tuple[int, bytes]:
+        """Record a STARTTLS upgrade."""
+        self.starttls_count += 1
+        return 220, b"Ready to start TLS"
+
+    def login(self, user: str, password: str) -> tuple[int, bytes]:
+        """Record login credentials, raising any injected failure first."""
+        if self.login_error is not None:
+            raise self.login_error
+        self.logins.append((user, password))
+        return 235, b"Authentication successful"
+
+    def noop(self) -> tuple[int, bytes]:
+        """Answer a NOOP keepalive."""
+        return 250, b"OK"
+
+    def quit(self) -> tuple[int, bytes]:
+        """Record a QUIT, as sent when a connection leaves the pool."""
+        self.quit_count += 1
+        return 221, b"Bye"
+
+    def close(self) -> None:
+        """Record closing the socket without a QUIT."""
+        self.close_count += 1
+
+    def send_message(self, msg: EmailMessage, *args: Any, **kwargs: Any) -> dict:
+        """Record a message, raising any injected failure first."""
+        if self.send_errors:
+            error = self.send_errors.popleft()
+            if error is not None:
+                raise error
+
+        recipient = msg["To"]
+        if recipient in self.refused_recipients:
+            raise smtplib.SMTPRecipientsRefused({recipient: (550, b"No such user")})
+
+        self.sent.append(msg)
+        return {}
@@ -0,0 +1,89 @@
+"""
+Shared fixtures for processor unit tests.
+
+Building a Summarizer creates an OpenAI client, so one is built per
+session with a mocked config. Each test gets a shallow copy with its own
+mock client, so client setup never leaks between tests. NewsletterContent
+is frozen, so the sample newsletters are shared per module; use
+dataclasses.replace for variants.
+"""
+
+import copy
+from collections.abc import Generator
+from unittest.mock import Mock, patch
+
+import pytest
+
+from src.processors.models import NewsletterContent
+from src.processors.newsletter_processor import NewsletterProcessor
+from src.processors.summarizer import Summarizer
+
+
+@pytest.fixture(scope="session")
+def processor_config() -> Mock:
+    """Config stand-in with test OpenAI settings and recipient."""
+    config = Mock()
+    config.openai.api_key = "test-key"
+    config.openai.model = "o4-mini"
+    config.openai.max_tokens = 4000
+    config.email.recipient_email = "test-recipient@example.com"
+    return config
+
+
+@pytest.fixture(scope="session")
+def shared_summarizer(processor_config: Mock) -> Generator[Summarizer, None, None]:
+    """One Summarizer for the whole session, backed by a mocked OpenAI client."""
+    with patch("src.processors.summarizer.OpenAI"):
+        yield Summarizer(processor_config)
+
+
+@pytest.fixture
+def summarizer(shared_summarizer: Summarizer) -> Summarizer:
+    """Per-test shallow copy of the shared Summarizer with a fresh mock client."""
+    instance = copy.copy(shared_summarizer)
+    instance.client = Mock()
+    return instance
+
+
+@pytest.fixture
+def newsletter_processor(
+    processor_config: Mock, summarizer: Summarizer
+) -> NewsletterProcessor:
+    """Fresh processor state per test around the shared Summarizer setup."""
+    return NewsletterProcessor(processor_config, summarizer=summarizer)
+
+
+@pytest.fixture(scope="module")
+def tech_newsletter() -> NewsletterContent:
+    """Sample technology newsletter shared across a test module."""
+    return NewsletterContent(
+        title="Tech Newsletter",
+        content="Latest technology updates",
+        source="tech_source",
+        date="2025-08-05",
+        metadata={"category": "technology"},
+    )
+
+
+@pytest.fixture(scope="module")
+def business_newsletter() -> NewsletterContent:
+    """Sample business newsletter shared across a test module."""
+    return NewsletterContent(
+        title="Business Newsletter",
+        content="Business content",
+        source="biz_source",
+        date="2025-08-05",
+        metadata={},
+    )
+
+
+@pytest.fixture(scope="module")
+def plain_newsletter() -> NewsletterContent:
+    """Sample newsletter without category metadata shared across a test module."""
+    return NewsletterContent(
+        title="Test Newsletter",
+        content="Test content",
+        source="test_source",
+        date="2025-08-05",
+        metadata={},
+    )
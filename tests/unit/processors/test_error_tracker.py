@@ -62,6 +62,27 @@ class TestErrorTracker:
         assert "KeyError" in error_types
         assert "RuntimeError" in error_types
 
+    def test_record_many_errors(self):
+        """Purpose: Verify batch recording matches individual recording."""
+        errors_data = [
+            ("Newsletter 1", ValueError("Invalid content")),
+            ("Newsletter 2", ValueError("Bad encoding")),
+            ("Newsletter 3", RuntimeError("Processing timeout")),
+        ]
+
+        self.error_tracker.record_many(errors_data)
+
+        backlog = self.error_tracker.get_backlog()
+        assert [entry["newsletter_title"] for entry in backlog] == [
+            "Newsletter 1",
+            "Newsletter 2",
+            "Newsletter 3",
+        ]
+
+        stats = self.error_tracker.get_error_stats()
+        assert stats["total_errors"] == 3
+        assert stats["error_types"] == {"ValueError": 2, "RuntimeError": 1}
+
     def test_error_stats_calculation(self):
         """Purpose: Verify error statistics are calculated correctly."""
         # Record various types of errors
@@ -143,6 +164,43 @@ class TestErrorTracker:
         # For now, just verify it doesn't break
         assert len(backlog) >= 0
 
+    def test_backlog_drops_oldest_entries(self):
+        """Purpose: Verify a bounded backlog keeps only the newest errors."""
+        tracker = ErrorTracker(backlog_max=5)
+
+        for i in range(12):
+            tracker.record_error(f"Newsletter {i}", Exception(f"Error {i}"))
+
+        backlog = tracker.get_backlog()
+        stats = tracker.get_error_stats()
+
+        assert [entry["newsletter_title"] for entry in backlog] == [
+            f"Newsletter {i}" for i in range(7, 12)
+        ]
+        assert stats["total_errors"] == 12
+        assert stats["recent_errors"] == backlog
+
+    def test_error_types_view_is_live_and_read_only(self):
+        """Purpose: Verify the type-count view tracks new errors without copying."""
+        view = self.error_tracker.error_types_view()
+        assert dict(view) == {}
+
+        self.error_tracker.record_error("Newsletter 1", ValueError("Error 1"))
+        self.error_tracker.record_error("Newsletter 2", ValueError("Error 2"))
+
+        assert view["ValueError"] == 2
+        with pytest.raises(TypeError):
+            view["ValueError"] = 0  # type: ignore[index]
+
+    def test_has_error_for_matches_recorded_titles(self):
+        """Purpose: Verify title lookups see recorded errors without a copy."""
+        assert not self.error_tracker.has_error_for("Newsletter 1")
+
+        self.error_tracker.record_error("Newsletter 1", ValueError("Error 1"))
+
+        assert self.error_tracker.has_error_for("Newsletter 1")
+        assert not self.error_tracker.has_error_for("Newsletter 2")
+
     def test_error_tracker_isolation(self):
         """Purpose: Verify multiple ErrorTracker instances don't interfere."""
         tracker1 = ErrorTracker()
@@ -83,6 +83,39 @@ class TestNewsletterContent:
         assert "🚀" in content.content
         assert "©®™" in content.content
 
+    def test_newsletter_content_is_immutable(self):
+        """Purpose: Verify validated content cannot be changed afterwards."""
+        import dataclasses
+
+        content = NewsletterContent(
+            title="Title",
+            content="Content",
+            source="source",
+            date="2025-08-05",
+            metadata={},
+        )
+
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            content.title = ""  # type: ignore[misc]
+        assert not hasattr(content, "__dict__")
+
+    def test_newsletter_content_is_hashable(self):
+        """Purpose: Verify content can key a dict or set despite its metadata."""
+        first, second = (
+            NewsletterContent(
+                title="Title",
+                content="Content",
+                source="source",
+                date="2025-08-05",
+                metadata={"uid": uid},
+                links=("https://example.com",),
+            )
+            for uid in ("1", "2")
+        )
+
+        assert hash(first) == hash(second)
+        assert len({first, second}) == 2  # metadata still counts for equality
+
 
 class TestProcessingResult:
     """Test ProcessingResult model."""
@@ -147,6 +180,18 @@ class TestProcessingResult:
         )
 
         assert result.errors == []
+        assert result.has_error("anything") is False
+
+    def test_has_error_matches_substring_of_any_message(self):
+        """Purpose: Verify has_error finds text inside individual messages."""
+        result = ProcessingResult(
+            success=False,
+            errors=["AI batch processing failed", "Failed to process 'Weekly'"],
+        )
+
+        assert result.has_error("batch processing")
+        assert result.has_error("'Weekly'")
+        assert not result.has_error("', '")  # Never matches across messages
 
     def test_mixed_success_partial_failure_result(self):
         """Purpose: Verify partial success scenario (some processed, some failed)."""
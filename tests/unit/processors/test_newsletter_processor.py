@@ -4,7 +4,9 @@ Unit tests for AI-powered newsletter processor core logic.
 Tests the new batch AI processing with fallback mechanisms.
 """
 
-from unittest.mock import Mock, patch
+import time
+from dataclasses import replace
+from unittest.mock import patch
 
 import pytest
 
@@ -12,13 +14,55 @@ from src.processors.models import NewsletterContent, ProcessingResult
 from src.processors.newsletter_processor import NewsletterProcessor
 from src.senders.models import EmailData
 
+# Newsletter date shared by every sample in this module
+_DATE = "2025-08-05"
+
+# The same day as an email Date header, from which the subject date is derived
+_HEADER_DATE = "Tue, 05 Aug 2025 08:00:00 +0000"
+
+
+def _assert_ok(result, processed, failed=0, errors=0):
+    """Assert a successful result with the given counts in one comparison."""
+    assert (
+        result.success,
+        result.email_data is not None,
+        result.processed_count,
+        result.failed_count,
+        len(result.errors),
+    ) == (True, True, processed, failed, errors)
+
+
+def _batch_fails(newsletters):
+    """Summarizer.summarize_newsletters stand-in that always fails."""
+    raise RuntimeError("AI batch failed")
+
+
+def _always_fail(content):
+    """Summarizer.summarize stand-in that always fails."""
+    raise RuntimeError("Individual processing failed")
+
+
+def _fail_on_invalid(content):
+    """Summarizer.summarize stand-in that rejects invalid content."""
+    if "Invalid content" in content:
+        raise ValueError("Cannot process invalid content")
+    return "Processed: " + content[:50]
+
+
+def _slow_first(content):
+    """Summarizer.summarize stand-in where the first summary finishes last."""
+    if content == "Content 0":
+        time.sleep(0.05)
+    return f"Summary of {content}"
+
 
 class TestNewsletterProcessor:
     """Test AI-powered NewsletterProcessor class."""
 
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.processor = NewsletterProcessor()
+    @pytest.fixture(autouse=True)
+    def _use_processor(self, newsletter_processor):
+        """Use a processor around the session-built Summarizer (see conftest.py)."""
+        self.processor = newsletter_processor
 
     def test_initialization(self):
         """Verify NewsletterProcessor initializes correctly with dependencies."""
@@ -26,8 +70,12 @@ class TestNewsletterProcessor:
         assert self.processor.error_tracker is not None
 
     @patch.object(NewsletterProcessor, "_create_structured_content")
-    def test_process_single_newsletter_success_ai(self, mock_create_structured):
+    def test_process_single_newsletter_success_ai(
+        self, mock_create_structured, tech_newsletter
+    ):
         """Test successful AI batch processing of single newsletter."""
+        newsletter = replace(tech_newsletter, date=_HEADER_DATE)
+
         # Mock AI summary data
         mock_summary_data = {
             "daily_highlights": ["重點 1", "重點 2"],
@@ -39,7 +87,7 @@ class TestNewsletterProcessor:
                 }
             },
             "reading_time": "預估 5 分鐘",
-            "meta": {"total_sources": 1, "processing_date": "2025-08-05"},
+            "meta": {"total_sources": 1, "processing_date": _DATE},
         }
 
         mock_create_structured.return_value = "Structured AI content"
@@ -50,30 +98,20 @@ class TestNewsletterProcessor:
         ) as mock_ai:
             mock_ai.return_value = mock_summary_data
 
-            newsletter = NewsletterContent(
-                title="Tech Newsletter",
-                content="Latest technology updates",
-                source="tech_source",
-                date="2025-08-05",
-                metadata={"category": "technology"},
-            )
-
             result = self.processor.process_newsletters([newsletter])
 
-            assert result.success is True
-            assert result.email_data is not None
-            assert result.processed_count == 1
-            assert result.failed_count == 0
-            assert len(result.errors) == 0
+            _assert_ok(result, processed=1)
 
-            # Verify EmailData structure
+            # Verify EmailData structure; the subject date comes from the header
             email_data = result.email_data
-            assert email_data.subject == "📧 每日電子報摘要 - 2025-08-05"
+            assert email_data.subject == f"📧 Daily Newsletter Summary - {_DATE}"
             assert email_data.content == "Structured AI content"
-            assert email_data.metadata["date"] == "2025-08-05"
+            assert email_data.metadata["date"] == _HEADER_DATE
             assert email_data.metadata["processed_count"] == 1
 
-    def test_process_multiple_newsletters_success_ai(self):
+    def test_process_multiple_newsletters_success_ai(
+        self, tech_newsletter, business_newsletter
+    ):
         """Test successful AI batch processing of multiple newsletters."""
         # Mock AI summary data
         mock_summary_data = {
@@ -91,7 +129,7 @@ class TestNewsletterProcessor:
                 },
             },
             "reading_time": "預估 8 分鐘",
-            "meta": {"total_sources": 2, "processing_date": "2025-08-05"},
+            "meta": {"total_sources": 2, "processing_date": _DATE},
         }
 
         with patch.object(
@@ -99,49 +137,30 @@ class TestNewsletterProcessor:
         ) as mock_ai:
             mock_ai.return_value = mock_summary_data
 
-            newsletters = [
-                NewsletterContent(
-                    "Tech Newsletter",
-                    "Technology content",
-                    "tech_source",
-                    "2025-08-05",
-                    {},
-                ),
-                NewsletterContent(
-                    "Business Newsletter",
-                    "Business content",
-                    "biz_source",
-                    "2025-08-05",
-                    {},
-                ),
-            ]
-
-            result = self.processor.process_newsletters(newsletters)
+            result = self.processor.process_newsletters(
+                [tech_newsletter, business_newsletter]
+            )
 
-            assert result.success is True
-            assert result.processed_count == 2
-            assert result.failed_count == 0
-            assert "每日智能摘要" in result.email_data.content
+            _assert_ok(result, processed=2)
+            assert "Daily Newsletter Summary" in result.email_data.content
 
     def test_process_empty_newsletter_list(self):
         """Test empty input list is handled gracefully."""
-        result = self.processor.process_newsletters([])
+        with patch.object(
+            self.processor.summarizer, "summarize_newsletters"
+        ) as mock_ai:
+            result = self.processor.process_newsletters([])
+
+        mock_ai.assert_not_called()
 
         assert result.success is False
         assert result.email_data is None
         assert result.processed_count == 0
         assert result.failed_count == 0
-        assert "No newsletters to process" in str(result.errors)
+        assert result.has_error("No newsletters to process")
 
-    def test_ai_batch_failure_fallback_to_individual(self):
+    def test_ai_batch_failure_fallback_to_individual(self, plain_newsletter):
         """Test fallback to individual processing when AI batch fails."""
-        newsletter = NewsletterContent(
-            title="Test Newsletter",
-            content="Test content",
-            source="test_source",
-            date="2025-08-05",
-            metadata={},
-        )
 
         # Mock AI batch to fail, individual to succeed
         with patch.object(
@@ -153,55 +172,61 @@ class TestNewsletterProcessor:
                 mock_batch.side_effect = Exception("AI batch processing failed")
                 mock_individual.return_value = "Individual summary"
 
-                result = self.processor.process_newsletters([newsletter])
+                result = self.processor.process_newsletters([plain_newsletter])
 
-                assert result.success is True
-                assert result.processed_count == 1
-                assert result.failed_count == 0
-                assert len(result.errors) == 1  # AI batch error recorded
+                _assert_ok(result, processed=1, errors=1)  # AI batch error recorded
                 assert "AI batch processing failed" in result.errors[0]
                 assert "Test Newsletter" in result.email_data.content
 
-    def test_both_ai_and_individual_processing_fail(self):
+    def test_both_ai_and_individual_processing_fail(self, monkeypatch):
         """Test complete failure when both AI and individual processing fail."""
         newsletters = [
-            NewsletterContent("Newsletter 1", "Content 1", "source1", "2025-08-05", {}),
-            NewsletterContent("Newsletter 2", "Content 2", "source2", "2025-08-05", {}),
+            NewsletterContent("Newsletter 1", "Content 1", "source1", _DATE, {}),
+            NewsletterContent("Newsletter 2", "Content 2", "source2", _DATE, {}),
         ]
 
-        # Mock both AI batch and individual processing to fail
-        with patch.object(
-            self.processor.summarizer, "summarize_newsletters"
-        ) as mock_batch:
-            with patch.object(
-                self.processor.summarizer, "summarize"
-            ) as mock_individual:
-                mock_batch.side_effect = Exception("AI batch failed")
-                mock_individual.side_effect = Exception("Individual processing failed")
+        # Both AI batch and individual processing fail
+        summarizer = self.processor.summarizer
+        monkeypatch.setattr(summarizer, "summarize_newsletters", _batch_fails)
+        monkeypatch.setattr(summarizer, "summarize", _always_fail)
 
-                result = self.processor.process_newsletters(newsletters)
+        result = self.processor.process_newsletters(newsletters)
 
-                assert result.success is False
-                assert result.email_data is None
-                assert result.processed_count == 0
-                assert result.failed_count == 2
+        assert result.success is False
+        assert result.email_data is None
+        assert result.processed_count == 0
+        assert result.failed_count == 2
 
-    def test_partial_individual_processing_success(self):
+    def test_partial_individual_processing_success(self, plain_newsletter, monkeypatch):
         """Test partial success in individual processing fallback."""
         newsletters = [
-            NewsletterContent(
-                "Valid Newsletter", "Valid content", "valid_source", "2025-08-05", {}
+            replace(
+                plain_newsletter, title="Valid Newsletter", content="Valid content"
             ),
-            NewsletterContent(
-                "Invalid Newsletter",
-                "Invalid content",
-                "invalid_source",
-                "2025-08-05",
-                {},
+            replace(
+                plain_newsletter, title="Invalid Newsletter", content="Invalid content"
             ),
         ]
 
-        # Mock AI batch to fail, individual processing to partially succeed
+        # AI batch fails, individual processing partially succeeds
+        summarizer = self.processor.summarizer
+        monkeypatch.setattr(summarizer, "summarize_newsletters", _batch_fails)
+        monkeypatch.setattr(summarizer, "summarize", _fail_on_invalid)
+
+        result = self.processor.process_newsletters(newsletters)
+
+        assert result.success is True  # At least one succeeded
+        assert result.processed_count == 1
+        assert result.failed_count == 1
+        assert "Valid Newsletter" in result.email_data.content
+
+    def test_individual_fallback_keeps_input_order(self, plain_newsletter):
+        """Test concurrent fallback summaries are combined in input order."""
+        newsletters = [
+            replace(plain_newsletter, title=f"Newsletter {i}", content=f"Content {i}")
+            for i in range(4)
+        ]
+
         with patch.object(
             self.processor.summarizer, "summarize_newsletters"
         ) as mock_batch:
@@ -209,60 +234,47 @@ class TestNewsletterProcessor:
                 self.processor.summarizer, "summarize"
             ) as mock_individual:
                 mock_batch.side_effect = Exception("AI batch failed")
-
-                def individual_side_effect(content):
-                    if "Invalid content" in content:
-                        raise ValueError("Cannot process invalid content")
-                    return "Processed: " + content[:50]
-
-                mock_individual.side_effect = individual_side_effect
+                mock_individual.side_effect = _slow_first
 
                 result = self.processor.process_newsletters(newsletters)
 
-                assert result.success is True  # At least one succeeded
-                assert result.processed_count == 1
-                assert result.failed_count == 1
-                assert "Valid Newsletter" in result.email_data.content
+        content = result.email_data.content
+        positions = [content.index(f"Summary of Content {i}") for i in range(4)]
+        assert positions == sorted(positions)
+        assert mock_individual.call_count == 4
 
-    def test_email_data_recipient_configuration(self):
+    def test_email_data_recipient_configuration(self, plain_newsletter, monkeypatch):
         """Test EmailData recipient is correctly configured."""
-        newsletter = NewsletterContent(
-            "Test Newsletter", "Test content", "test_source", "2025-08-05", {}
+        # Recipient comes from the injected config (see conftest.py)
+        monkeypatch.setattr(
+            self.processor.config.email, "recipient_email", "custom@example.com"
         )
 
-        # Mock config to return specific recipient
-        with patch("src.processors.newsletter_processor.get_config") as mock_config:
-            mock_config.return_value.email.recipient_email = (
-                "test-recipient@example.com"
-            )
-
-            # Mock successful AI processing
-            with patch.object(
-                self.processor.summarizer, "summarize_newsletters"
-            ) as mock_ai:
-                mock_ai.return_value = {
-                    "daily_highlights": ["Test highlight"],
-                    "categories": {
-                        "general": {
-                            "summary": "Test",
-                            "priority": "high",
-                            "items": ["Test Newsletter"],
-                        }
-                    },
-                    "reading_time": "5 min",
-                    "meta": {"total_sources": 1, "processing_date": "2025-08-05"},
-                }
+        # Mock successful AI processing
+        with patch.object(
+            self.processor.summarizer, "summarize_newsletters"
+        ) as mock_ai:
+            mock_ai.return_value = {
+                "daily_highlights": ["Test highlight"],
+                "categories": {
+                    "general": {
+                        "summary": "Test",
+                        "priority": "high",
+                        "items": ["Test Newsletter"],
+                    }
+                },
+                "reading_time": "5 min",
+                "meta": {"total_sources": 1, "processing_date": _DATE},
+            }
 
-                result = self.processor.process_newsletters([newsletter])
+            result = self.processor.process_newsletters([plain_newsletter])
 
-                assert result.success is True
-                assert result.email_data.recipient == "test-recipient@example.com"
+            assert result.success is True
+            assert result.email_data.recipient == "custom@example.com"
 
-    def test_structured_content_formatting(self):
+    def test_structured_content_formatting(self, plain_newsletter):
         """Test structured content formatting from AI summary."""
-        newsletter = NewsletterContent(
-            "Newsletter A", "Content A", "source_a", "2025-08-05", {}
-        )
+        newsletter = replace(plain_newsletter, title="Newsletter A")
 
         # Mock AI to return structured data
         mock_summary_data = {
@@ -280,7 +292,7 @@ class TestNewsletterProcessor:
                 },
             },
             "reading_time": "預估 8 分鐘",
-            "meta": {"total_sources": 1, "processing_date": "2025-08-05"},
+            "meta": {"total_sources": 1, "processing_date": _DATE},
         }
 
         with patch.object(
@@ -293,46 +305,33 @@ class TestNewsletterProcessor:
             email_content = result.email_data.content
 
             # Verify structured formatting
-            assert "每日智能摘要" in email_content
-            assert "🎯 今日重點" in email_content
-            assert "今日重點 1" in email_content
-            assert "今日重點 2" in email_content
-            assert "🚀 科技創新" in email_content
-            assert "💰 商業金融" in email_content
-            assert "科技創新的重點摘要" in email_content
-            assert "商業金融趨勢" in email_content
-            assert "處理統計" in email_content
-
-    def test_error_tracking_integration(self):
-        """Test errors are properly recorded in error tracker."""
-        newsletter = NewsletterContent(
-            "Failing Newsletter", "Content", "source", "2025-08-05", {}
-        )
+            expected = [
+                "Daily Newsletter Summary",
+                "🎯 Today's Highlights",
+                "今日重點 1",
+                "今日重點 2",
+                "🚀 Technology",
+                "💰 Business",
+                "科技創新的重點摘要",
+                "商業金融趨勢",
+                "Processing Summary",
+            ]
+            missing = [s for s in expected if s not in email_content]
+            assert not missing, missing
 
-        # Mock both processing methods to fail
-        with patch.object(
-            self.processor.summarizer, "summarize_newsletters"
-        ) as mock_batch:
-            with patch.object(
-                self.processor.summarizer, "summarize"
-            ) as mock_individual:
-                mock_batch.side_effect = RuntimeError("AI Processing failed")
-                mock_individual.side_effect = RuntimeError(
-                    "Individual processing failed"
-                )
+    def test_error_tracking_integration(self, plain_newsletter, monkeypatch):
+        """Test errors are properly recorded in error tracker."""
+        newsletter = replace(plain_newsletter, title="Failing Newsletter")
 
-                self.processor.process_newsletters([newsletter])
+        # Both processing methods fail
+        summarizer = self.processor.summarizer
+        monkeypatch.setattr(summarizer, "summarize_newsletters", _batch_fails)
+        monkeypatch.setattr(summarizer, "summarize", _always_fail)
 
-                # Verify error was recorded in error tracker
-                backlog = self.processor.error_tracker.get_backlog()
-                assert len(backlog) >= 1
+        self.processor.process_newsletters([newsletter])
 
-                # Check for AI batch processing error
-                ai_error_found = any(
-                    "AI_BATCH_PROCESSING" in error.get("newsletter_title", "")
-                    for error in backlog
-                )
-                assert ai_error_found
+        # Verify the AI batch processing error was recorded in error tracker
+        assert self.processor.error_tracker.has_error_for("AI_BATCH_PROCESSING")
 
     def test_create_structured_content_method(self):
         """Test _create_structured_content method directly."""
@@ -355,14 +354,37 @@ class TestNewsletterProcessor:
 
         content = self.processor._create_structured_content(summary_data)
 
-        assert "每日智能摘要" in content
-        assert "重點測試 1" in content
-        assert "重點測試 2" in content
-        assert "🚀 科技創新" in content
-        assert "技術創新摘要測試" in content
-        assert "測試項目 1" in content
-        assert "預估 6 分鐘" in content
-        assert "正常" in content  # AI 模式顯示
+        expected = [
+            "Daily Newsletter Summary",
+            "重點測試 1",
+            "重點測試 2",
+            "🚀 Technology",
+            "技術創新摘要測試",
+            "測試項目 1",
+            "預估 6 分鐘",
+            "AI Mode: Normal",
+        ]
+        missing = [s for s in expected if s not in content]
+        assert not missing, missing
+
+    def test_structured_content_sections_are_cached(self):
+        """Test identical summaries reuse the rendered highlight/category sections."""
+        from src.processors.newsletter_processor import _render_summary_sections
+
+        summary_data = {
+            "daily_highlights": ["Cached highlight"],
+            "categories": {
+                "technology": {"summary": "Cached summary", "items": ["Item"]}
+            },
+        }
+
+        _render_summary_sections.cache_clear()
+        first = self.processor._create_structured_content(summary_data)
+        second = self.processor._create_structured_content(summary_data)
+
+        assert "Cached highlight" in first
+        assert "Cached highlight" in second
+        assert _render_summary_sections.cache_info().hits == 1
 
     def test_fallback_combine_content_method(self):
         """Test _combine_content method for fallback scenarios."""
@@ -373,9 +395,69 @@ class TestNewsletterProcessor:
 
         content = self.processor._combine_content(sections)
 
-        assert "每日電子報摘要" in content
-        assert "本日共收集 2 份電子報" in content
-        assert "Newsletter 1" in content
-        assert "Newsletter 2" in content
-        assert "處理電子報數量：2" in content
-        assert "Good Morning Agent 自動生成" in content
+        expected = [
+            "Daily Newsletter Summary",
+            "Today's digest includes 2 newsletters",
+            "Newsletter 1",
+            "Newsletter 2",
+            "Processed newsletters: 2",
+            "generated by Good Morning Agent",
+        ]
+        missing = [s for s in expected if s not in content]
+        assert not missing, missing
+
+
+class TestNewsletterProcessorMetadata:
+    """Test metadata handling in NewsletterProcessor output."""
+
+    @pytest.fixture(autouse=True)
+    def _use_processor(self, newsletter_processor):
+        """Use a processor around the session-built Summarizer (see conftest.py)."""
+        self.processor = newsletter_processor
+
+    def setup_method(self):
+        """Set up canned summary data."""
+        self.summary_data = {
+            "daily_highlights": ["Highlight"],
+            "categories": {},
+            "reading_time": "Estimated 5 minutes",
+            "meta": {"total_sources": 1},
+        }
+
+    def test_email_metadata_is_read_only(self, tech_newsletter):
+        """Test output metadata is a shared read-only view, not a copy."""
+        with patch.object(
+            self.processor.summarizer,
+            "summarize_newsletters",
+            return_value=self.summary_data,
+        ):
+            result = self.processor.process_newsletters([tech_newsletter])
+
+        metadata = result.email_data.metadata
+        assert metadata["processed_count"] == 1
+
+        with pytest.raises(TypeError):
+            metadata["x"] = 1
+
+    def test_duplicate_newsletters_deduplicated(self, tech_newsletter):
+        """Test identical content from different sources is summarized once."""
+        newsletters = [
+            tech_newsletter,
+            replace(
+                tech_newsletter,
+                title="Tech Newsletter (repost)",
+                content="  Latest   Technology updates\n",
+                source="other_source",
+            ),
+        ]
+
+        with patch.object(
+            self.processor.summarizer,
+            "summarize_newsletters",
+            return_value=self.summary_data,
+        ) as mock_summarize:
+            result = self.processor.process_newsletters(newsletters)
+
+        assert result.processed_count == 1
+        assert result.email_data.metadata["deduped_count"] == 1
+        assert mock_summarize.call_args.args[0] == newsletters[:1]
@@ -4,97 +4,108 @@ Unit tests for AI-powered summarizer functionality.
 Tests both AI summarization and fallback truncation logic.
 """
 
+import functools
 import json
-from unittest.mock import Mock, patch
+from types import SimpleNamespace
 
 import pytest
 
 from src.processors.models import NewsletterContent
-from src.processors.summarizer import Summarizer
+
+# Long inputs are built once per module rather than per test call
+_LONG_ASCII = "This is a long newsletter content that needs summarization. " * 10
+_LONG_NEWSLETTER = "This is a very long newsletter content. " * 20
+_LONG_CHINESE = "測試中文內容處理" * 50
+_A_STR_300 = "a" * 300
+_A_STR_301 = "a" * 301
+
+# Structured AI response, serialized once at import
+_AI_RESPONSE_JSON = json.dumps(
+    {
+        "daily_highlights": ["重點 1", "重點 2", "重點 3"],
+        "categories": {
+            "tech_innovation": {
+                "summary": "科技創新摘要",
+                "priority": "high",
+                "items": ["項目 1", "項目 2"],
+            },
+            "business_finance": {
+                "summary": "商業金融摘要",
+                "priority": "medium",
+                "items": ["項目 3"],
+            },
+        },
+        "reading_time": "預估 8 分鐘",
+        "meta": {"total_sources": 2, "processing_date": "2024-01-01 12:00:00"},
+    },
+    ensure_ascii=False,
+)
+
+
+@functools.cache
+def _completion(content: str) -> SimpleNamespace:
+    """Chat completion response carrying content (built once per content)."""
+    return SimpleNamespace(
+        choices=[SimpleNamespace(message=SimpleNamespace(content=content))]
+    )
+
+
+class _StubCompletions:
+    """Plain stand-in for client.chat.completions with a canned reply."""
+
+    def __init__(self, reply: SimpleNamespace | Exception) -> None:
+        self._reply = reply
+        self.call_count = 0
+
+    def create(self, **kwargs) -> SimpleNamespace:
+        self.call_count += 1
+        if isinstance(self._reply, Exception):
+            raise self._reply
+        return self._reply
+
+
+def _stub_client(reply: SimpleNamespace | Exception) -> SimpleNamespace:
+    """OpenAI client stand-in whose completions return (or raise) reply."""
+    return SimpleNamespace(chat=SimpleNamespace(completions=_StubCompletions(reply)))
 
 
 class TestSummarizer:
     """Test AI-powered Summarizer class."""
 
-    def setup_method(self):
-        """Set up test fixtures."""
-        # Mock the config to avoid needing real API keys in tests
-        with patch("src.processors.summarizer.get_config") as mock_config:
-            mock_config.return_value.openai.api_key = "test-key"
-            mock_config.return_value.openai.model = "o4-mini"
-            mock_config.return_value.openai.max_tokens = 4000
-            self.summarizer = Summarizer()
-
-    @patch("src.processors.summarizer.OpenAI")
-    def test_single_content_ai_summarization_success(self, mock_openai_class):
-        """Test successful AI summarization of single content."""
-        # Mock OpenAI response
-        mock_client = Mock()
-        mock_openai_class.return_value = mock_client
+    @pytest.fixture(autouse=True)
+    def _use_summarizer(self, summarizer):
+        """Use the session-built Summarizer (see conftest.py)."""
+        self.summarizer = summarizer
 
-        mock_response = Mock()
-        mock_response.choices = [Mock()]
-        mock_response.choices[0].message.content = "這是一個 AI 生成的摘要"
-        mock_client.chat.completions.create.return_value = mock_response
-
-        self.summarizer.client = mock_client
+    @pytest.mark.ai_mock
+    def test_single_content_ai_summarization_success(self):
+        """Test successful AI summarization of single content."""
+        # Stub OpenAI response
+        self.summarizer.client = _stub_client(_completion("這是一個 AI 生成的摘要"))
 
         content = "This is a long newsletter content that needs summarization."
         result = self.summarizer.summarize(content)
 
         assert result == "這是一個 AI 生成的摘要"
-        assert mock_client.chat.completions.create.called
+        assert self.summarizer.client.chat.completions.call_count == 1
 
-    @patch("src.processors.summarizer.OpenAI")
-    def test_single_content_ai_failure_fallback(self, mock_openai_class):
+    @pytest.mark.ai_mock
+    def test_single_content_ai_failure_fallback(self):
         """Test fallback to truncation when AI fails."""
-        # Mock OpenAI to raise exception
-        mock_client = Mock()
-        mock_openai_class.return_value = mock_client
-        mock_client.chat.completions.create.side_effect = Exception("API Error")
-
-        self.summarizer.client = mock_client
+        # Stub OpenAI to raise exception
+        self.summarizer.client = _stub_client(Exception("API Error"))
 
-        content = "This is a long newsletter content that needs summarization. " * 10
-        result = self.summarizer.summarize(content)
+        result = self.summarizer.summarize(_LONG_ASCII)
 
         # Should fallback to truncation
         assert len(result) <= 303  # max 300 chars + "..."
         assert result.endswith("...")
 
-    @patch("src.processors.summarizer.OpenAI")
-    def test_multiple_newsletters_ai_summarization_success(self, mock_openai_class):
+    @pytest.mark.ai_mock
+    def test_multiple_newsletters_ai_summarization_success(self):
         """Test successful AI summarization of multiple newsletters."""
-        # Mock OpenAI response with structured JSON
-        mock_client = Mock()
-        mock_openai_class.return_value = mock_client
-
-        ai_response = {
-            "daily_highlights": ["重點 1", "重點 2", "重點 3"],
-            "categories": {
-                "tech_innovation": {
-                    "summary": "科技創新摘要",
-                    "priority": "high",
-                    "items": ["項目 1", "項目 2"],
-                },
-                "business_finance": {
-                    "summary": "商業金融摘要",
-                    "priority": "medium",
-                    "items": ["項目 3"],
-                },
-            },
-            "reading_time": "預估 8 分鐘",
-            "meta": {"total_sources": 2, "processing_date": "2024-01-01 12:00:00"},
-        }
-
-        mock_response = Mock()
-        mock_response.choices = [Mock()]
-        mock_response.choices[0].message.content = json.dumps(
-            ai_response, ensure_ascii=False
-        )
-        mock_client.chat.completions.create.return_value = mock_response
-
-        self.summarizer.client = mock_client
+        # Stub OpenAI response with structured JSON
+        self.summarizer.client = _stub_client(_completion(_AI_RESPONSE_JSON))
 
         newsletters = [
             NewsletterContent(
@@ -120,19 +131,11 @@ class TestSummarizer:
         assert "business_finance" in result["categories"]
         assert result["meta"]["total_sources"] == 2
 
-    @patch("src.processors.summarizer.OpenAI")
-    def test_multiple_newsletters_ai_json_parse_failure(self, mock_openai_class):
+    @pytest.mark.ai_mock
+    def test_multiple_newsletters_ai_json_parse_failure(self):
         """Test fallback when AI returns invalid JSON."""
-        # Mock OpenAI to return invalid JSON
-        mock_client = Mock()
-        mock_openai_class.return_value = mock_client
-
-        mock_response = Mock()
-        mock_response.choices = [Mock()]
-        mock_response.choices[0].message.content = "Invalid JSON response"
-        mock_client.chat.completions.create.return_value = mock_response
-
-        self.summarizer.client = mock_client
+        # Stub OpenAI to return invalid JSON
+        self.summarizer.client = _stub_client(_completion("Invalid JSON response"))
 
         newsletters = [
             NewsletterContent(
@@ -156,47 +159,42 @@ class TestSummarizer:
         with pytest.raises(ValueError, match="Newsletters list cannot be empty"):
             self.summarizer.summarize_newsletters([])
 
-    def test_fallback_summarize_truncation_logic(self):
-        """Test fallback truncation logic for edge cases."""
-        # Test content longer than 300 chars
-        long_content = "This is a very long newsletter content. " * 20
-        result = self.summarizer._fallback_summarize(long_content)
-
-        assert len(result) <= 303  # max 300 chars + "..."
-        assert result.endswith("...")
-
-    def test_fallback_summarize_short_content_preserved(self):
-        """Test fallback preserves short content completely."""
-        short_content = "This is a short newsletter content."
-        result = self.summarizer._fallback_summarize(short_content)
-
-        assert result == short_content
-        assert not result.endswith("...")
-
-    def test_fallback_summarize_unicode_handling(self):
-        """Test fallback handles Unicode content correctly."""
-        unicode_content = "測試中文內容處理" * 50
-        result = self.summarizer._fallback_summarize(unicode_content)
-
-        assert len(result) <= 303  # max 300 chars + "..."
-        assert result.endswith("...")
-        # Should not corrupt Unicode characters
-        truncated_part = result[:-3]
-        assert len(truncated_part) <= 300
+    @pytest.mark.parametrize(
+        "content, expect_truncated",
+        [
+            pytest.param(_LONG_NEWSLETTER, True, id="long"),
+            pytest.param("This is a short newsletter content.", False, id="short"),
+            pytest.param(_LONG_CHINESE, True, id="unicode"),
+            pytest.param(_A_STR_300, False, id="exactly-300"),
+            pytest.param(_A_STR_301, True, id="exactly-301"),
+            pytest.param("", False, id="empty"),
+        ],
+    )
+    def test_fallback_summarize_truncation(self, content, expect_truncated):
+        """Test fallback keeps short content and truncates long content cleanly."""
+        result = self.summarizer._fallback_summarize(content)
+
+        if expect_truncated:
+            assert len(result) <= 303  # max 300 chars + "..."
+            assert result.endswith("...")
+            # Truncation cuts whole characters, so Unicode is never corrupted
+            assert content.startswith(result[:-3])
+        else:
+            assert result == content
 
     def test_create_combined_content_structure(self):
         """Test combined content structure for AI processing."""
         newsletters = [
             NewsletterContent(
                 title="Newsletter 1",
-                content="Content 1",
+                content="Content of the first newsletter",
                 source="source1@example.com",
                 date="2024-01-01",
                 metadata={},
             ),
             NewsletterContent(
                 title="Newsletter 2",
-                content="Content 2",
+                content="Content of the second newsletter",
                 source="source2@example.com",
                 date="2024-01-01",
                 metadata={},
@@ -205,12 +203,13 @@ class TestSummarizer:
 
         result = self.summarizer._create_combined_content(newsletters)
 
-        assert "=== 電子報 1: Newsletter 1 ===" in result
-        assert "=== 電子報 2: Newsletter 2 ===" in result
-        assert "來源: source1@example.com" in result
-        assert "來源: source2@example.com" in result
-        assert "Content 1" in result
-        assert "Content 2" in result
+        assert "=== Newsletter 1: Newsletter 1 ===" in result
+        assert "=== Newsletter 2: Newsletter 2 ===" in result
+        assert "Source: source1@example.com" in result
+        assert "Source: source2@example.com" in result
+        # Cleaning drops lines of 10 characters or fewer, so these are longer
+        assert "Content of the first newsletter" in result
+        assert "Content of the second newsletter" in result
 
     def test_create_fallback_summary_structure(self):
         """Test fallback summary structure when AI fails."""
@@ -0,0 +1,41 @@
+"""
+Shared fixtures for sender unit tests.
+
+MessageFormatter holds no state, so one instance serves a whole module.
+EmailSender is built once per module too, but each test gets a shallow
+copy with a fresh config and its rate-limit state cleared, so sends in one
+test never delay the next. The copies share the frozen RetryPolicy, which
+is safe. SecurityManager tests mutate send counts and timestamps and keep
+building their own instance.
+"""
+
+import copy
+from unittest.mock import patch
+
+import pytest
+
+from src.senders.email_sender import EmailSender
+from src.senders.message_formatter import MessageFormatter
+from tests.support.email_config import MockEmailConfig
+
+
+@pytest.fixture(scope="module")
+def formatter() -> MessageFormatter:
+    """One stateless MessageFormatter per test module."""
+    return MessageFormatter()
+
+
+@pytest.fixture(scope="module")
+def shared_email_sender() -> EmailSender:
+    """One validated EmailSender per test module with a 2 second send interval."""
+    with patch.dict("os.environ", {"EMAIL_SEND_INTERVAL": "2"}):
+        return EmailSender(MockEmailConfig())
+
+
+@pytest.fixture
+def email_sender(shared_email_sender: EmailSender) -> EmailSender:
+    """Per-test shallow copy of the shared EmailSender that has never sent."""
+    instance = copy.copy(shared_email_sender)
+    instance.config = MockEmailConfig()
+    instance.last_send_time = None
+    return instance
@@ -2,41 +2,37 @@
 Unit tests for email sender.
 """
 
+import random
 import smtplib
-from unittest.mock import MagicMock, Mock, patch
+from unittest.mock import patch
 
 import pytest
 
-from src.senders.email_sender import EmailSender, EmailSenderError
+from src.senders import _pool
+from src.senders.email_sender import EmailSender, EmailSenderError, RetryPolicy
 from src.senders.models import EmailData, SendResult
-
-
-class MockEmailConfig:
-    """Mock email configuration for testing."""
-
-    def __init__(self):
-        self.smtp_server = "smtp.gmail.com"
-        self.smtp_port = 587
-        self.sender_email = "sender@example.com"
-        self.sender_password = "sender_password"
-        self.address = "main@example.com"
-        self.password = "main_password"
+from tests.support.email_config import MockEmailConfig
 
 
 class TestEmailSender:
     """Test EmailSender class."""
 
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.config = MockEmailConfig()
-        with patch.dict("os.environ", {"EMAIL_SEND_INTERVAL": "2"}):
-            self.sender = EmailSender(self.config)
+    @pytest.fixture(autouse=True)
+    def _use_sender(self, email_sender):
+        """Use a copy of the module-built EmailSender (see conftest.py)."""
+        self.sender = email_sender
+        self.config = email_sender.config
+
+        # Start every test without pooled SMTP connections
+        _pool.drain()
 
     def test_initialization(self):
         """Test EmailSender initialization."""
         assert self.sender.config == self.config
         assert self.sender.formatter is not None
-        assert self.sender.security_manager is not None
+        assert self.sender.retry_policy == RetryPolicy()
+        assert self.sender.send_interval == 2
+        assert self.sender.last_send_time is None
 
     def test_initialization_missing_smtp_server(self):
         """Test initialization with missing SMTP server."""
@@ -55,34 +51,25 @@ class TestEmailSender:
         with pytest.raises(EmailSenderError, match="Sender email is required"):
             EmailSender(config)
 
-    @patch("src.senders.email_sender.smtplib.SMTP")
-    def test_validate_connection_success(self, mock_smtp):
+    def test_validate_connection_success(self, fake_smtp):
         """Test successful connection validation."""
-        # Mock successful SMTP connection
-        mock_server = Mock()
-        mock_smtp.return_value.__enter__.return_value = mock_server
-
         result = self.sender.validate_connection()
 
         assert result is True
-        mock_server.starttls.assert_called_once()
-        mock_server.login.assert_called_once_with(
-            "sender@example.com", "sender_password"
-        )
+        assert fake_smtp.starttls_count == 1
+        assert fake_smtp.logins == [("sender@example.com", "sender_password")]
 
-    @patch("src.senders.email_sender.smtplib.SMTP")
-    def test_validate_connection_failure(self, mock_smtp):
+    def test_validate_connection_failure(self, fake_smtp):
         """Test connection validation failure."""
-        # Mock SMTP connection failure
-        mock_smtp.side_effect = smtplib.SMTPException("Connection failed")
+        # Simulate SMTP connection failure
+        fake_smtp.connect_error = smtplib.SMTPException("Connection failed")
 
         result = self.sender.validate_connection()
 
         assert result is False
 
-    @patch("src.senders.email_sender.smtplib.SMTP")
     def test_validate_connection_uses_main_credentials_when_sender_missing(
-        self, mock_smtp
+        self, fake_smtp
     ):
         """Test connection validation uses main credentials when sender missing."""
         # Remove sender credentials
@@ -91,13 +78,10 @@ class TestEmailSender:
         config.sender_password = None
         sender = EmailSender(config)
 
-        mock_server = Mock()
-        mock_smtp.return_value.__enter__.return_value = mock_server
-
         result = sender.validate_connection()
 
         assert result is True
-        mock_server.login.assert_called_once_with("main@example.com", "main_password")
+        assert fake_smtp.logins == [("main@example.com", "main_password")]
 
     def test_send_email_missing_recipient(self):
         """Test send_email with missing recipient."""
@@ -170,6 +154,10 @@ class TestEmailSender:
         assert result.retry_count == 2
         assert mock_send.call_count == 3
 
+        # Each retry waits somewhere between zero and the capped backoff
+        cap = self.sender.retry_policy.cap
+        assert all(0 <= call.args[0] <= cap for call in mock_sleep.call_args_list)
+
     @patch("src.senders.email_sender.EmailSender._send_single_email")
     @patch("time.sleep")
     def test_retry_send_all_attempts_fail(self, mock_sleep, mock_send):
@@ -187,6 +175,7 @@ class TestEmailSender:
 
         assert result.success is False
         assert "Persistent error" in result.error_message
+        assert result.error is mock_send.side_effect
         assert result.retry_count == 3  # max_retries + 1
         assert mock_send.call_count == 3
 
@@ -200,21 +189,90 @@ class TestEmailSender:
             metadata={},
         )
 
-        mock_send.side_effect = Exception("Authentication failed")
+        mock_send.side_effect = smtplib.SMTPAuthenticationError(
+            535, "Authentication failed"
+        )
 
         result = self.sender._retry_send(email_data, max_retries=3)
 
         assert result.success is False
         assert "Authentication failed" in result.error_message
+        assert result.retry_count == 0
         # Should not retry on auth errors
         mock_send.assert_called_once()
 
-    @patch("src.senders.email_sender.smtplib.SMTP")
-    @patch("src.senders.email_sender.MIMEMultipart")
-    @patch("src.senders.email_sender.MIMEText")
-    def test_send_single_email_success(
-        self, mock_mime_text, mock_mime_multipart, mock_smtp
+    @patch("src.senders.email_sender.EmailSender._send_single_email")
+    def test_retry_send_wrapped_recipient_refused_no_retry(self, mock_send):
+        """Test retry send stops when the wrapped SMTP error is unrecoverable."""
+        email_data = EmailData(
+            recipient="invalid@example.com",
+            subject="Test Subject",
+            content="Test content",
+            metadata={},
+        )
+
+        refused = smtplib.SMTPRecipientsRefused(
+            {"invalid@example.com": (550, "No such user")}
+        )
+        error = EmailSenderError(f"Recipient refused: {refused}")
+        error.__cause__ = refused
+        mock_send.side_effect = error
+
+        result = self.sender._retry_send(email_data, max_retries=3)
+
+        assert result.success is False
+        assert "Recipient refused" in result.error_message
+        assert result.error.__cause__ is refused
+        mock_send.assert_called_once()
+
+    @patch("src.senders.email_sender.EmailSender._send_single_email")
+    @patch("time.sleep")
+    def test_retry_send_retries_temporary_recipient_refusal(
+        self, mock_sleep, mock_send
     ):
+        """Test a greylisted (450) recipient is retried, not dropped."""
+        email_data = EmailData(
+            recipient="test@example.com",
+            subject="Test Subject",
+            content="Test content",
+            metadata={},
+        )
+
+        greylisted = smtplib.SMTPRecipientsRefused(
+            {"test@example.com": (450, b"Greylisted, try again later")}
+        )
+        error = EmailSenderError(f"Recipient refused: {greylisted}")
+        error.__cause__ = greylisted
+        mock_send.side_effect = [error, "<test@example.com>"]
+
+        result = self.sender._retry_send(email_data, max_retries=3)
+
+        assert result.success is True
+        assert result.retry_count == 1
+        assert mock_send.call_count == 2
+
+    @patch("src.senders.email_sender.EmailSender._send_single_email")
+    @patch("time.sleep")
+    def test_retry_send_retries_disconnects(self, mock_sleep, mock_send):
+        """Test dropped connections are retried."""
+        email_data = EmailData(
+            recipient="test@example.com",
+            subject="Test Subject",
+            content="Test content",
+            metadata={},
+        )
+
+        mock_send.side_effect = [
+            smtplib.SMTPServerDisconnected("Connection unexpectedly closed"),
+            "<test@example.com>",
+        ]
+
+        result = self.sender._retry_send(email_data, max_retries=3)
+
+        assert result.success is True
+        assert result.retry_count == 1
+
+    def test_send_single_email_success(self, fake_smtp):
         """Test successful single email send."""
         email_data = EmailData(
             recipient="test@example.com",
@@ -223,28 +281,91 @@ class TestEmailSender:
             metadata={"date": "2025-08-05"},
         )
 
-        # Mock SMTP server
-        mock_server = Mock()
-        mock_smtp.return_value.__enter__.return_value = mock_server
+        result = self.sender._send_single_email(email_data)
 
-        # Mock message creation to return a message ID
-        mock_message = MagicMock()
-        mock_message.get.return_value = "<test-message-id>"
-        mock_message.__setitem__ = MagicMock()  # Allow item assignment
-        mock_message.__getitem__ = MagicMock()  # Allow item access
-        mock_mime_multipart.return_value = mock_message
+        assert isinstance(result, str)
+        assert fake_smtp.starttls_count == 1
+        assert fake_smtp.logins == [("sender@example.com", "sender_password")]
+        assert len(fake_smtp.sent) == 1
 
-        result = self.sender._send_single_email(email_data)
+    def test_send_single_email_unicode_subject(self, fake_smtp):
+        """Test a Unicode subject reaches the server intact."""
+        email_data = EmailData(
+            recipient="test@example.com",
+            subject="每日摘要 📧",
+            content="Test content",
+            metadata={},
+        )
+
+        self.sender._send_single_email(email_data)
+
+        assert fake_smtp.sent[0]["Subject"] == "每日摘要 📧"
+
+    def test_send_single_email_reuses_pooled_connection(self, fake_smtp):
+        """Test consecutive sends share one authenticated SMTP connection."""
+        email_data = EmailData(
+            recipient="test@example.com",
+            subject="Test Subject",
+            content="Test content",
+            metadata={},
+        )
+
+        self.sender._send_single_email(email_data)
+        self.sender._send_single_email(email_data)
+
+        assert fake_smtp.connections == 1
+        assert len(fake_smtp.logins) == 1
+        assert len(fake_smtp.sent) == 2
+        assert fake_smtp.quit_count == 0
+
+    def test_pool_key_does_not_hold_password(self):
+        """Test pool keys separate credentials without storing the password."""
+        key = self.sender._pool_key
+
+        assert "sender_password" not in repr(key)
+        self.sender.config.sender_password = "rotated_password"
+        assert self.sender._pool_key != key
+
+    @patch("time.sleep")
+    def test_send_batch_uses_one_smtp_session(self, mock_sleep, fake_smtp):
+        """Test a batch logs in once and sends every email over that session."""
+        emails = [
+            EmailData(
+                recipient=f"user{i}@example.com",
+                subject="Test Subject",
+                content="Test content",
+                metadata={},
+            )
+            for i in range(5)
+        ]
+
+        result = self.sender.send_batch(emails)
 
-        assert result == "<test-message-id>"
-        mock_server.starttls.assert_called_once()
-        mock_server.login.assert_called_once_with(
-            "sender@example.com", "sender_password"
+        assert result.sent_count == 5
+        assert fake_smtp.connections == 1
+        assert fake_smtp.starttls_count == 1
+        assert len(fake_smtp.logins) == 1
+        assert len(fake_smtp.sent) == 5
+
+    def test_send_single_email_failure_discards_connection(self, fake_smtp):
+        """Test a connection that failed mid-send is closed, not pooled."""
+        email_data = EmailData(
+            recipient="test@example.com",
+            subject="Test Subject",
+            content="Test content",
+            metadata={},
         )
-        mock_server.send_message.assert_called_once()
 
-    @patch("src.senders.email_sender.smtplib.SMTP")
-    def test_send_single_email_smtp_auth_error(self, mock_smtp):
+        fake_smtp.send_errors.append(smtplib.SMTPServerDisconnected("Connection lost"))
+
+        with pytest.raises(EmailSenderError, match="SMTP error"):
+            self.sender._send_single_email(email_data)
+        self.sender._send_single_email(email_data)
+
+        assert fake_smtp.quit_count == 1
+        assert fake_smtp.connections == 2
+
+    def test_send_single_email_smtp_auth_error(self, fake_smtp):
         """Test single email send with SMTP authentication error."""
         email_data = EmailData(
             recipient="test@example.com",
@@ -253,17 +374,16 @@ class TestEmailSender:
             metadata={},
         )
 
-        mock_server = Mock()
-        mock_server.login.side_effect = smtplib.SMTPAuthenticationError(
+        fake_smtp.login_error = smtplib.SMTPAuthenticationError(
             535, "Authentication failed"
         )
-        mock_smtp.return_value.__enter__.return_value = mock_server
 
         with pytest.raises(EmailSenderError, match="Authentication failed"):
             self.sender._send_single_email(email_data)
 
-    @patch("src.senders.email_sender.smtplib.SMTP")
-    def test_send_single_email_recipients_refused(self, mock_smtp):
+        assert fake_smtp.close_count == 1
+
+    def test_send_single_email_recipients_refused(self, fake_smtp):
         """Test single email send with recipients refused error."""
         email_data = EmailData(
             recipient="invalid@example.com",
@@ -272,22 +392,12 @@ class TestEmailSender:
             metadata={},
         )
 
-        mock_server = Mock()
-        mock_server.send_message.side_effect = smtplib.SMTPRecipientsRefused(
-            {"invalid@example.com": (550, "No such user")}
-        )
-        mock_smtp.return_value.__enter__.return_value = mock_server
+        fake_smtp.refused_recipients.add("invalid@example.com")
 
-        with patch("src.senders.email_sender.MIMEMultipart"):
-            with pytest.raises(EmailSenderError, match="Recipient refused"):
-                self.sender._send_single_email(email_data)
+        with pytest.raises(EmailSenderError, match="Recipient refused"):
+            self.sender._send_single_email(email_data)
 
-    @patch("src.senders.email_sender.smtplib.SMTP")
-    @patch("src.senders.email_sender.MIMEMultipart")
-    @patch("src.senders.email_sender.MIMEText")
-    def test_send_single_email_uses_main_credentials_when_needed(
-        self, mock_mime_text, mock_mime_multipart, mock_smtp
-    ):
+    def test_send_single_email_uses_main_credentials_when_needed(self, fake_smtp):
         """Test single email send uses main credentials when sender credentials missing."""
         # Configure without sender credentials
         config = MockEmailConfig()
@@ -302,19 +412,10 @@ class TestEmailSender:
             metadata={},
         )
 
-        mock_server = Mock()
-        mock_smtp.return_value.__enter__.return_value = mock_server
-
-        mock_message = MagicMock()
-        mock_message.get.return_value = "<test-message-id>"
-        mock_message.__setitem__ = MagicMock()  # Allow item assignment
-        mock_message.__getitem__ = MagicMock()  # Allow item access
-        mock_mime_multipart.return_value = mock_message
-
         sender._send_single_email(email_data)
 
         # Should use main credentials
-        mock_server.login.assert_called_once_with("main@example.com", "main_password")
+        assert fake_smtp.logins == [("main@example.com", "main_password")]
 
     def test_send_email_unexpected_error(self):
         """Test send_email handles unexpected errors."""
@@ -334,3 +435,33 @@ class TestEmailSender:
         assert result.success is False
         assert "Unexpected error" in result.error_message
         assert result.retry_count == 0
+
+
+class TestRetryPolicy:
+    """Test RetryPolicy backoff calculation."""
+
+    @patch(
+        "src.senders.email_sender.random.uniform",
+        side_effect=lambda low, high: high,
+    )
+    def test_next_delay_exponential_and_capped(self, mock_uniform):
+        """Test the jitter range doubles per attempt and stops at the cap."""
+        policy = RetryPolicy(base=0.1, cap=0.5)
+
+        delays = [policy.next_delay(attempt) for attempt in range(5)]
+
+        assert delays == pytest.approx([0.1, 0.2, 0.4, 0.5, 0.5])
+        mock_uniform.assert_called_with(0, 0.5)
+
+    def test_next_delay_full_jitter_range(self, monkeypatch):
+        """Test seeded delays fall anywhere from zero up to the backoff."""
+        policy = RetryPolicy(base=1.0, cap=30.0)
+        monkeypatch.setattr(
+            "src.senders.email_sender.random.uniform", random.Random(1234).uniform
+        )
+
+        for attempt in range(8):
+            bound = min(30.0, 2.0**attempt)
+            delays = [policy.next_delay(attempt) for _ in range(50)]
+            assert all(0 <= delay <= bound for delay in delays)
+            assert min(delays) < bound / 2 < max(delays)
@@ -7,15 +7,14 @@ from unittest.mock import patch
 
 import pytest
 
-from src.senders.message_formatter import MessageFormatter
-
 
 class TestMessageFormatter:
     """Test MessageFormatter class."""
 
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.formatter = MessageFormatter()
+    @pytest.fixture(autouse=True)
+    def _use_formatter(self, formatter):
+        """Use the module-built MessageFormatter (see conftest.py)."""
+        self.formatter = formatter
 
     def test_format_plain_text_basic(self):
         """Test basic plain text formatting."""
@@ -77,6 +76,8 @@ class TestMessageFormatter:
 
         assert "2025-08-05" in result
         assert "14:30:00" in result
+        assert "生成時間：2025-08-05T14:30:00" in result  # Footer uses the same time
+        mock_datetime.now.assert_called_once()
 
     def test_add_headers_includes_required_info(self):
         """Test that headers include required information."""
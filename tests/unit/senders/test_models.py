@@ -2,6 +2,8 @@
 Unit tests for email sender models.
 """
 
+import dataclasses
+
 import pytest
 
 from src.senders.models import EmailData, SendResult
@@ -50,6 +52,16 @@ class TestEmailData:
                 recipient="invalid-email", subject="Test", content="Test", metadata={}
             )
 
+    def test_email_data_is_immutable(self):
+        """Test validated email data cannot be changed afterwards."""
+        data = EmailData(
+            recipient="test@example.com", subject="Test", content="Test", metadata={}
+        )
+
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            data.recipient = ""  # type: ignore[misc]
+        assert not hasattr(data, "__dict__")
+
 
 class TestSendResult:
     """Test SendResult model."""
@@ -67,19 +79,51 @@ class TestSendResult:
 
     def test_failed_send_result(self):
         """Test creating failed SendResult."""
-        result = SendResult(success=False, error_message="SMTP error", retry_count=3)
+        result = SendResult(
+            success=False, retry_count=3, error=RuntimeError("SMTP error")
+        )
 
         assert result.success is False
         assert result.message_id is None
         assert result.error_message == "SMTP error"
         assert result.retry_count == 3
 
+    def test_failed_send_result_from_exception(self):
+        """Test a failed SendResult keeps its exception and derives the message."""
+        error = ConnectionError("Connection reset")
+        result = SendResult(success=False, error=error)
+
+        assert result.error is error
+        assert result.error_message == "Connection reset"
+
+    def test_failed_send_result_drops_tracebacks(self):
+        """Test a stored exception chain no longer pins its stack frames."""
+        try:
+            try:
+                raise OSError("Connection reset")
+            except OSError as cause:
+                raise RuntimeError("Send failed") from cause
+        except RuntimeError as e:
+            result = SendResult(success=False, error=e)
+
+        assert result.error.__traceback__ is None
+        assert result.error.__cause__.__traceback__ is None
+        assert result.error_message == "Send failed"
+
     def test_successful_result_without_message_id_raises_error(self):
         """Test that successful result without message_id raises ValueError."""
         with pytest.raises(ValueError, match="Successful send must have a message_id"):
             SendResult(success=True)
 
-    def test_failed_result_without_error_message_raises_error(self):
-        """Test that failed result without error_message raises ValueError."""
-        with pytest.raises(ValueError, match="Failed send must have an error_message"):
+    def test_failed_result_without_error_raises_error(self):
+        """Test that failed result without an error raises ValueError."""
+        with pytest.raises(ValueError, match="Failed send must have an error"):
             SendResult(success=False)
+
+    def test_send_result_is_immutable(self):
+        """Test send results cannot be changed afterwards."""
+        result = SendResult(success=False, error=RuntimeError("SMTP error"))
+
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            result.success = True  # type: ignore[misc]
+        assert not hasattr(result, "__dict__")
@@ -2,8 +2,10 @@
 Unit tests for security manager.
 """
 
+import random
 import time
-from datetime import datetime, timedelta
+from datetime import date
+from email.utils import parsedate_to_datetime
 from unittest.mock import patch
 
 import pytest
@@ -73,6 +75,15 @@ class TestSecurityManager:
 
         assert "Good Morning Agent" in headers["X-Mailer"]
         assert headers["X-Priority"] == "3 (Normal)"
+        # RFC 2822 date with a numeric UTC offset
+        assert parsedate_to_datetime(headers["Date"]).tzinfo is not None
+
+    def test_add_authentication_headers_leaves_template_unchanged(self):
+        """Test per-email headers are not written back into the shared template."""
+        self.security_manager.add_authentication_headers()
+
+        assert "Message-ID" not in SecurityManager._HEADER_TEMPLATE
+        assert "Date" not in SecurityManager._HEADER_TEMPLATE
 
     def test_validate_send_frequency_initial(self):
         """Test send frequency validation on first send."""
@@ -82,7 +93,7 @@ class TestSecurityManager:
     def test_validate_send_frequency_too_soon(self):
         """Test send frequency validation when sending too soon."""
         # Simulate a recent send
-        self.security_manager.last_send_time = time.time()
+        self.security_manager.last_send_time = time.monotonic()
 
         # Should not allow immediate send
         assert self.security_manager.validate_send_frequency() is False
@@ -90,7 +101,7 @@ class TestSecurityManager:
     def test_validate_send_frequency_after_interval(self):
         """Test send frequency validation after sufficient interval."""
         # Simulate a send 3 seconds ago (more than 2s interval)
-        self.security_manager.last_send_time = time.time() - 3
+        self.security_manager.last_send_time = time.monotonic() - 3
 
         # Should allow send
         assert self.security_manager.validate_send_frequency() is True
@@ -116,7 +127,7 @@ class TestSecurityManager:
     def test_wait_if_needed_with_wait(self, mock_sleep):
         """Test wait_if_needed when wait is required."""
         # Simulate recent send
-        self.security_manager.last_send_time = time.time() - 1  # 1 second ago
+        self.security_manager.last_send_time = time.monotonic() - 1  # 1 second ago
 
         self.security_manager.wait_if_needed()
 
@@ -149,6 +160,18 @@ class TestSecurityManager:
         # Should have some variation (at least the original)
         assert len(results) >= 1
 
+    def test_diversify_subject_uses_every_suffix(self):
+        """Test subject diversification draws from the whole suffix pool."""
+        subject = "Test Subject"
+
+        with patch("src.senders.security_manager._rng", random.Random(0)):
+            suffixes = {
+                self.security_manager._diversify_subject(subject)[len(subject) :]
+                for _ in range(200)
+            }
+
+        assert suffixes == set(SecurityManager._SUBJECT_SUFFIXES)
+
     def test_diversify_content(self):
         """Test content diversification."""
         content = "Test content for diversification"
@@ -174,7 +197,7 @@ class TestSecurityManager:
 
         # Hashes should be different
         assert hash1 != hash2
-        # Should be 8 characters (MD5 truncated)
+        # Should be 8 characters (4-byte BLAKE2s digest)
         assert len(hash1) == 8
         assert len(hash2) == 8
 
@@ -194,6 +217,9 @@ class TestSecurityManager:
         assert id1.endswith("@good-morning-agent>")
         assert id2.startswith("<")
         assert id2.endswith("@good-morning-agent>")
+        # 32 hex digits between the brackets and the domain
+        int(id1[1:33], 16)
+        assert id1[33] == "@"
 
     def test_reset_daily_count_if_needed_same_day(self):
         """Test daily count reset on same day."""
@@ -205,24 +231,18 @@ class TestSecurityManager:
         # Should not reset on same day
         assert self.security_manager.daily_send_count == initial_count
 
-    @patch("src.senders.security_manager.datetime")
-    def test_reset_daily_count_if_needed_new_day(self, mock_datetime):
+    def test_reset_daily_count_if_needed_new_day(self):
         """Test daily count reset on new day."""
-        # Set up current state
+        # Set up current state: last reset was yesterday
         self.security_manager.daily_send_count = 5
-        yesterday = datetime.now() - timedelta(days=1)
-        self.security_manager.daily_reset_time = yesterday.replace(
-            hour=0, minute=0, second=0, microsecond=0
-        )
-
-        # Mock current time to be today
-        today = datetime.now()
-        mock_datetime.now.return_value = today
+        yesterday = date.today().toordinal() - 1
+        self.security_manager._last_reset_ordinal = yesterday
 
         self.security_manager._reset_daily_count_if_needed()
 
         # Should reset count
         assert self.security_manager.daily_send_count == 0
+        assert self.security_manager._last_reset_ordinal == yesterday + 1
 
     def test_apply_anti_spam_measures_error_handling(self):
         """Test error handling in anti-spam measures."""